@@ -7,11 +7,305 @@ Supports both PR comments and benchmark dashboard generation.
 """
 
 import argparse
+import contextlib
+import functools
+import gzip
 import json
+import marshal
+import mmap
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 
+# Files at least this large are decoded straight from a memory map
+MMAP_MIN_BYTES = 64 * 1024
+
+# gzip level for --gzip outputs (close to max ratio at a fraction of level 9 cost)
+GZIP_LEVEL = 6
+
+# Directory entries shown when no summaries are found
+EMPTY_LISTING_LIMIT = 20
+
+# Below this many summaries, process start-up outweighs parallel parsing
+PARALLEL_PARSE_MIN = 16
+
+# Rating hierarchy for comparison
+RATING_HIERARCHY = {'vague': 0, 'regular': 1, 'good': 2, 'outstanding': 3}
+
+# Judgment overall_better -> winner column label
+WINNER_LABELS = {'A': "Baseline", 'B': "With Skill", 'TIE': "Tie"}
+
+# Static parts of the PR comment; only the rows vary between runs
+COMMENT_TITLE = "# 📊 Evaluation Results\n\n"
+COMMENT_TABLE_HEADER = (
+    "| Test Name | Model | Baseline | With Skill | Cases Pass | Winner |\n"
+    "|-----------|-------|----------|------------|------------|--------|\n"
+)
+COMMENT_ROW = "| [{artifact}]() | {model} | {baseline_rating} | {skill_rating} | {pass_emoji} {skill_pass} | {winner} |\n"
+
+
+# Shared codec instances: json.dumps with keyword options builds a fresh
+# JSONEncoder on every call, so bind the configured one once.
+_DECODER = json.JSONDecoder()
+# Outputs are machine-read, so no indentation (which also keeps the C
+# encoder fast path).
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def load_json(data: bytes):
+    """Parse JSON from raw UTF-8 bytes."""
+    return _DECODER.decode(data.decode("utf-8"))
+
+
+def dump_json(obj) -> bytes:
+    """Serialize obj as compact UTF-8 JSON bytes, ready for write_bytes."""
+    return _ENCODER.encode(obj).encode("utf-8")
+
+
+def iter_summary_files(results_dir: Path, root_entries: list | None = None):
+    """
+    Yield summary-*.json paths under results_dir.
+
+    Iterative os.scandir walk: avoids the per-entry Path objects and
+    extra stat calls of a recursive Path.glob.
+
+    Args:
+        results_dir: Root directory to search
+        root_entries: Optional list that receives the paths found directly
+            in results_dir, so callers can report them without a second scan
+
+    Yields:
+        (artifact_name, path) per summary file, where the artifact is the
+        containing directory's name (known from the walk, not re-derived)
+    """
+    root = str(results_dir)
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        artifact_name = os.path.basename(current)
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if root_entries is not None and current == root:
+                        root_entries.append(Path(entry.path))
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.startswith("summary-") and entry.name.endswith(".json"):
+                        yield artifact_name, Path(entry.path)
+        except OSError:
+            continue
+
+
+# Shared read-only default for missing nested objects
+_EMPTY = {}
+
+
+def _first(items) -> dict:
+    """First element of a list, or an empty mapping when missing/empty."""
+    return items[0] if items else _EMPTY
+
+
+# Leaf fields of results[0] that the PR comment reads
+PR_RESULT_FIELDS = (
+    'skill', 'model', 'baseline_rating', 'skill_rating',
+    'baseline_pass_count', 'skill_pass_count',
+)
+
+
+def extract_pr_fields(summary: dict) -> dict:
+    """
+    Project a summary down to the fields generate_pr_comment reads.
+
+    Drops the large per-test payloads (full responses, reasoning) right
+    after parsing, so they are neither kept alive nor sent back from
+    worker processes.
+
+    Args:
+        summary: Parsed summary
+
+    Returns:
+        Summary of the same shape holding only results[0]'s table fields
+    """
+    if not isinstance(summary, dict):
+        return {}
+    eval_result = _first(summary.get('results'))
+    if not eval_result:
+        return {}
+
+    fields = {key: eval_result[key] for key in PR_RESULT_FIELDS if key in eval_result}
+    judgment = eval_result.get('judgment') or _EMPTY
+    if 'overall_better' in judgment:
+        fields['judgment'] = {'overall_better': judgment['overall_better']}
+    return {'results': [fields]}
+
+
+# Result fields whose values repeat across artifacts (same provider/model/skill)
+INTERNED_FIELDS = ('skill', 'model', 'baseline_rating', 'skill_rating')
+
+
+def intern_common_fields(summary) -> None:
+    """
+    Share one str object per distinct value of INTERNED_FIELDS, in place.
+
+    Must run in the consuming process: strings unpickled from a worker
+    are fresh copies, whatever the worker did with them.
+    """
+    if not isinstance(summary, dict):
+        return
+    for result in summary.get('results') or ():
+        if not isinstance(result, dict):
+            continue
+        for key in INTERNED_FIELDS:
+            value = result.get(key)
+            if type(value) is str:
+                result[key] = sys.intern(value)
+
+
+def read_summary_text(summary_file: Path) -> str:
+    """
+    Read a summary file as text.
+
+    Large files are decoded directly from a read-only memory map, skipping
+    the intermediate bytes copy; small ones are read normally since the
+    mapping costs more than it saves.
+
+    Args:
+        summary_file: Path to a summary-*.json file
+
+    Returns:
+        Decoded file contents
+    """
+    with open(summary_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            return f.read().decode("utf-8")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, "utf-8")
+
+
+def load_summary(summary_file: Path, keep_raw: bool = True, pr_fields_only: bool = False):
+    """
+    Read and parse one summary file.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        summary_file: Path to a summary-*.json file
+        keep_raw: Also return the original bytes (benchmark mode copies
+            them through); otherwise the file is only decoded
+        pr_fields_only: Keep only what the PR comment needs (see
+            extract_pr_fields)
+
+    Returns:
+        (raw_bytes, summary, error) - raw_bytes is None unless keep_raw;
+        summary is None and error holds the message when the file is not
+        valid JSON
+    """
+    try:
+        if keep_raw:
+            raw = summary_file.read_bytes()
+            return raw, load_json(raw), None
+        summary = _DECODER.decode(read_summary_text(summary_file))
+        return None, extract_pr_fields(summary) if pr_fields_only else summary, None
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        return None, None, str(e)
+
+
+def load_parse_cache(cache_file: Path) -> dict:
+    """
+    Load parsed summaries cached by a previous run.
+
+    marshal handles plain JSON trees (dict/list/str/number) faster than
+    pickle; its format is tied to the Python version, so an unreadable or
+    foreign cache is simply discarded.
+
+    Args:
+        cache_file: Cache path
+
+    Returns:
+        Mapping of (path, mtime_ns, size, pr_fields_only) -> parsed summary
+    """
+    try:
+        cache = marshal.loads(cache_file.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_parse_cache(cache_file: Path, cache: dict) -> None:
+    """Persist parsed summaries; a failed write only costs the next run a reparse."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(marshal.dumps(cache))
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not write parse cache {cache_file}: {e}")
+
+
+def load_summaries(summary_files: list, keep_raw: bool, pr_fields_only: bool = False,
+                   cache_file: Path | None = None) -> list:
+    """
+    Load every summary file, in order.
+
+    Each file is independent and parsing is CPU-bound, so large batches are
+    spread over worker processes. With a cache file, summaries whose
+    (path, mtime, size) are unchanged since the last run are not reparsed.
+
+    Args:
+        summary_files: Sorted summary paths
+        keep_raw: Also return original bytes (see load_summary)
+        pr_fields_only: Project summaries for the PR comment (see load_summary)
+        cache_file: Optional read-through parse cache
+
+    Returns:
+        (raw_bytes, summary, error) per file, matching summary_files
+    """
+    cache = {}
+    keys = [None] * len(summary_files)
+    if cache_file:
+        # Only stat when there is a cache to validate against
+        cache = load_parse_cache(cache_file)
+        for i, summary_file in enumerate(summary_files):
+            st = summary_file.stat()
+            # Projected and full summaries must not be served for each other
+            keys[i] = (str(summary_file), st.st_mtime_ns, st.st_size, pr_fields_only)
+
+    misses = [f for f, key in zip(summary_files, keys) if key is None or key not in cache]
+    load = functools.partial(load_summary, keep_raw=keep_raw, pr_fields_only=pr_fields_only)
+    if len(misses) >= PARALLEL_PARSE_MIN:
+        with ProcessPoolExecutor() as executor:
+            parsed = dict(zip(misses, executor.map(load, misses, chunksize=8)))
+    else:
+        parsed = {f: load(f) for f in misses}
+
+    loaded = []
+    fresh_cache = {}
+    for summary_file, key in zip(summary_files, keys):
+        if summary_file in parsed:
+            entry = parsed[summary_file]
+        else:
+            # Cache hit: benchmark mode still copies the original bytes
+            entry = (summary_file.read_bytes() if keep_raw else None, cache[key], None)
+        if entry[2] is None:
+            intern_common_fields(entry[1])
+            if key is not None:
+                fresh_cache[key] = entry[1]
+        loaded.append(entry)
+
+    if cache_file:
+        save_parse_cache(cache_file, fresh_cache)
+
+    return loaded
+
+
+@functools.lru_cache(maxsize=None)
+def _pass_emoji(baseline_rating: str, skill_rating: str) -> str:
+    """✅ when the skill rating is at least the baseline rating, else ❌."""
+    baseline_score = RATING_HIERARCHY.get(baseline_rating, -1)
+    skill_score = RATING_HIERARCHY.get(skill_rating, -1)
+    return "✅" if skill_score >= baseline_score else "❌"
+
+
 def generate_pr_comment(results: list) -> str:
     """
     Generate GitHub PR comment from results.
@@ -22,24 +316,20 @@ def generate_pr_comment(results: list) -> str:
     Returns:
         Markdown comment string
     """
-    comment = "# 📊 Evaluation Results\n\n"
+    parts = [COMMENT_TITLE]
 
     if results:
-        comment += f"Processed {len(results)} evaluation(s).\n\n"
+        parts.append(f"Processed {len(results)} evaluation(s).\n\n")
 
         # Build table with results
-        comment += "| Test Name | Model | Baseline | With Skill | Cases Pass | Winner |\n"
-        comment += "|-----------|-------|----------|------------|------------|--------|\n"
-
-        # Rating hierarchy for comparison
-        rating_hierarchy = {'vague': 0, 'regular': 1, 'good': 2, 'outstanding': 3}
+        parts.append(COMMENT_TABLE_HEADER)
 
         for result in results:
             summary = result['summary']
             artifact = result['artifact']
 
             # Extract key data from nested results[0]
-            eval_result = summary.get('results', [{}])[0] if summary.get('results') else {}
+            eval_result = _first(summary.get('results'))
 
             skill = eval_result.get('skill', 'N/A')
             model = eval_result.get('model', 'N/A')
@@ -47,66 +337,96 @@ def generate_pr_comment(results: list) -> str:
             skill_rating = eval_result.get('skill_rating', 'N/A')
             baseline_pass = eval_result.get('baseline_pass_count', 'N/A')
             skill_pass = eval_result.get('skill_pass_count', 'N/A')
-            overall_better = eval_result.get('judgment', {}).get('overall_better', 'N/A')
-
-            # Determine winner
-            if overall_better == 'A':
-                winner = "Baseline"
-            elif overall_better == 'B':
-                winner = "With Skill"
-            elif overall_better == 'TIE':
-                winner = "Tie"
-            else:
-                winner = "N/A"
+            judgment = eval_result.get('judgment') or _EMPTY
+            overall_better = judgment.get('overall_better', 'N/A')
+
+            winner = WINNER_LABELS.get(overall_better, "N/A")
 
             # Determine emoji for cases pass
-            baseline_score = rating_hierarchy.get(baseline_rating, -1)
-            skill_score = rating_hierarchy.get(skill_rating, -1)
-            pass_emoji = "✅" if skill_score >= baseline_score else "❌"
+            pass_emoji = _pass_emoji(baseline_rating, skill_rating)
 
             # Build row
-            test_link = f"[{artifact}]()"
-            comment += f"| {test_link} | {model} | {baseline_rating} | {skill_rating} | {pass_emoji} {skill_pass} | {winner} |\n"
-
-        comment += "\n"
+            parts.append(COMMENT_ROW.format(
+                artifact=artifact,
+                model=model,
+                baseline_rating=baseline_rating,
+                skill_rating=skill_rating,
+                pass_emoji=pass_emoji,
+                skill_pass=skill_pass,
+                winner=winner,
+            ))
+
+        parts.append("\n")
     else:
-        comment += "No evaluation results found.\n"
+        parts.append("No evaluation results found.\n")
 
-    return comment
+    return "".join(parts)
 
 
-def generate_benchmark_data(results: list, output_dir: Path) -> None:
+def generate_benchmark_data(results: list, output_dir: Path, compress: bool = False) -> None:
     """
     Generate benchmark data files for dashboard.
 
     Args:
-        results: List of result dictionaries
+        results: List of result dictionaries (optional 'raw' holds the
+            summary file's original bytes)
         output_dir: Directory to write benchmark data
+        compress: Also write a .json.gz next to every .json (for serving
+            with Content-Encoding: gzip)
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for result in results:
-        summary = result['summary']
-        artifact = result['artifact']
-
-        # Save individual benchmark data
-        benchmark_file = output_dir / f"{artifact}.json"
-        benchmark_file.write_text(json.dumps(summary, indent=2))
-
-    # Save aggregated data for dashboard
-    aggregated = {
-        "generated_at": json.dumps(None),  # Will be set by generate_dashboard_data.py
-        "results": [
-            {
-                "artifact": r['artifact'],
-                "summary": r['summary']
-            }
-            for r in results
-        ]
-    }
+    def write_artifact(path: Path, data: bytes) -> None:
+        path.write_bytes(data)
+        if compress:
+            # mtime=0 keeps the archive bytes reproducible across runs
+            path.with_suffix(".json.gz").write_bytes(
+                gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0))
+
+    # Artifacts sharing a name overwrite one another; only the last one's
+    # file survives, so skip writing the earlier ones at all.
+    last_index = {result['artifact']: index for index, result in enumerate(results)}
 
+    # Stream the aggregate while per-artifact files are written on worker
+    # threads (file writes release the GIL), so the whole corpus is never
+    # held as one serialized string and writes overlap serialization.
     aggregated_file = output_dir / "benchmark_aggregated.json"
-    aggregated_file.write_text(json.dumps(aggregated, indent=2))
+    with contextlib.ExitStack() as stack:
+        writer = stack.enter_context(ThreadPoolExecutor(max_workers=4))
+        pending = []
+        sinks = [stack.enter_context(open(aggregated_file, "wb"))]
+        if compress:
+            sinks.append(stack.enter_context(gzip.GzipFile(
+                aggregated_file.with_suffix(".json.gz"), "wb",
+                compresslevel=GZIP_LEVEL, mtime=0)))
+
+        def emit(data: bytes) -> None:
+            for sink in sinks:
+                sink.write(data)
+
+        # generated_at is set later by generate_dashboard_data.py
+        emit(b'{"generated_at":' + dump_json(json.dumps(None)) + b',"results":[')
+
+        for index, result in enumerate(results):
+            artifact = result['artifact']
+
+            # Save individual benchmark data: the source bytes are already
+            # valid JSON, so copy them through instead of re-serializing
+            if last_index[artifact] == index:
+                raw = result.get('raw')
+                pending.append(writer.submit(
+                    write_artifact, output_dir / f"{artifact}.json",
+                    raw if raw is not None else dump_json(result['summary'])))
+
+            if index:
+                emit(b",")
+            emit(dump_json({"artifact": artifact, "summary": result['summary']}))
+
+        emit(b"]}")
+
+        # Surface any write error
+        for future in pending:
+            future.result()
 
 
 def main():
@@ -119,6 +439,10 @@ def main():
                        help="Output directory for benchmark mode")
     parser.add_argument("--output-file", type=Path, default="comment.md",
                        help="Output file for PR comment mode")
+    parser.add_argument("--gzip", action="store_true",
+                       help="Benchmark mode: also write gzip-compressed .json.gz copies")
+    parser.add_argument("--cache-file", type=Path, default=None,
+                       help="Reuse parsed summaries across runs (keyed by path, mtime and size)")
     args = parser.parse_args()
 
     if args.mode == "benchmark" and not args.output_dir:
@@ -127,35 +451,46 @@ def main():
     print(f"==> Consolidating results (mode: {args.mode})")
 
     # Find all summary files
-    summary_files = sorted(args.results_dir.glob("**/summary-*.json"))
+    root_entries = []
+    summaries = list(iter_summary_files(args.results_dir, root_entries))
 
-    if not summary_files:
+    if not summaries:
         print(f"No results found in {args.results_dir}")
-        print(f"Directory contents: {list(args.results_dir.glob('*'))}")
+        # Reuse the walk's top-level listing instead of scanning again
+        print(f"Directory contents: {root_entries[:EMPTY_LISTING_LIMIT]}")
 
         if args.mode == "pr-comment":
-            Path(args.output_file).write_text("# Evaluation Results\n\nNo results found.\n")
+            Path(args.output_file).write_bytes(b"# Evaluation Results\n\nNo results found.\n")
         sys.exit(0)
 
+    # Deterministic order for reproducible comments
+    summaries.sort(key=lambda item: item[1])
+    summary_files = [path for _, path in summaries]
+
     # Process results
     all_results = []
     failed = 0
 
-    for summary_file in summary_files:
-        try:
-            summary = json.loads(summary_file.read_text())
-            artifact_name = summary_file.parent.name
+    # Benchmark mode copies the original bytes through; the PR comment only
+    # needs a handful of fields per summary
+    benchmark_mode = args.mode == "benchmark"
+    loaded = load_summaries(summary_files, keep_raw=benchmark_mode,
+                            pr_fields_only=not benchmark_mode,
+                            cache_file=args.cache_file)
 
-            all_results.append({
-                "artifact": artifact_name,
-                "summary": summary,
-            })
+    for (artifact_name, _), (raw, summary, error) in zip(summaries, loaded):
+        if error is not None:
+            print(f"❌ {artifact_name} - Could not parse JSON: {error}")
+            failed += 1
+            continue
 
-            print(f"✅ {artifact_name}")
+        all_results.append({
+            "artifact": artifact_name,
+            "summary": summary,
+            "raw": raw,
+        })
 
-        except json.JSONDecodeError as e:
-            print(f"❌ {summary_file.parent.name} - Could not parse JSON: {e}")
-            failed += 1
+        print(f"✅ {artifact_name}")
 
     print(f"\nSummary:")
     print(f"  Processed: {len(all_results)}")
@@ -164,11 +499,11 @@ def main():
     # Generate output based on mode
     if args.mode == "pr-comment":
         comment = generate_pr_comment(all_results)
-        args.output_file.write_text(comment)
+        args.output_file.write_bytes(comment.encode("utf-8"))
         print(f"\n✓ Comment saved to {args.output_file}")
 
     elif args.mode == "benchmark":
-        generate_benchmark_data(all_results, args.output_dir)
+        generate_benchmark_data(all_results, args.output_dir, compress=args.gzip)
         print(f"\n✓ Benchmark data saved to {args.output_dir}")
 
     sys.exit(0)
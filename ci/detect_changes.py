@@ -5,11 +5,217 @@ Detect modified skills in a PR.
 Outputs space-separated skill names to stdout (for GitHub Actions integration).
 """
 
+import json
+import os
+import re
 import subprocess
 import sys
+import urllib.error
+import urllib.request
 from pathlib import Path
 
 
+GITHUB_API_URL = os.environ.get("GITHUB_API_URL", "https://api.github.com")
+
+# rel="next" target in a GitHub pagination Link header
+NEXT_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+
+def _checkout_is_pr(pr_number: str) -> bool:
+    """
+    Check that HEAD is the requested PR before its local diff is trusted.
+
+    pull_request runs set GITHUB_REF to refs/pull/<n>/merge; otherwise HEAD
+    must match a fetched pull/<n>/head or pull/<n>/merge ref.
+    """
+    pr_refs = (f"refs/pull/{pr_number}/merge", f"refs/pull/{pr_number}/head")
+    if os.environ.get("GITHUB_REF") in pr_refs:
+        return True
+
+    for ref in (f"pull/{pr_number}/head", f"pull/{pr_number}/merge"):
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD", f"{ref}^{{commit}}"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        shas = result.stdout.split()
+        if result.returncode == 0 and len(shas) == 2 and shas[0] == shas[1]:
+            return True
+
+    return False
+
+
+def checkout_head_sha(pr_number: str) -> str | None:
+    """
+    Get HEAD of the local checkout when it is the requested PR.
+
+    Answers from git alone, with no GitHub API call.
+
+    Args:
+        pr_number: Pull request number HEAD must belong to
+
+    Returns:
+        HEAD commit sha, or None without a checkout of that PR
+    """
+    if not Path(".git").exists():
+        return None
+
+    try:
+        if not _checkout_is_pr(pr_number):
+            return None
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+
+    if result.returncode != 0:
+        return None
+
+    return result.stdout.strip() or None
+
+
+def list_pr_files_git(pr_number: str) -> list[str] | None:
+    """
+    List files changed against the PR base using the local checkout.
+
+    When the job already has the PR checked out this answers in a few
+    milliseconds with no network round trip.
+
+    Args:
+        pr_number: Pull request number HEAD must belong to
+
+    Returns:
+        Changed file paths, or None if there is no usable checkout/base ref
+        or HEAD is not the requested PR
+    """
+    if not Path(".git").exists():
+        return None
+
+    try:
+        if not _checkout_is_pr(pr_number):
+            return None
+    except OSError:
+        return None
+
+    base_ref = os.environ.get("GITHUB_BASE_REF") or "main"
+    result = subprocess.run(
+        ["git", "diff", "--name-only", f"origin/{base_ref}...HEAD"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    # Shallow clones without the base ref fail here; fall back to the API
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+
+    return result.stdout.strip().split("\n")
+
+
+def _api_get(url: str, token: str):
+    """Open an authenticated GitHub REST API request."""
+    request = urllib.request.Request(url, headers={
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+    })
+    return urllib.request.urlopen(request, timeout=30)
+
+
+def pr_head_sha(pr_number: str, token: str) -> str | None:
+    """
+    Get the head commit of a PR.
+
+    Uses the REST API inside Actions (GITHUB_REPOSITORY set), gh elsewhere.
+
+    Args:
+        pr_number: Pull request number
+        token: GitHub token
+
+    Returns:
+        Head commit sha, or None if it could not be determined
+    """
+    repository = os.environ.get("GITHUB_REPOSITORY")
+    if repository:
+        try:
+            with _api_get(f"{GITHUB_API_URL}/repos/{repository}/pulls/{pr_number}", token) as response:
+                return json.loads(response.read())["head"]["sha"] or None
+        except (urllib.error.URLError, TimeoutError, ValueError, KeyError, TypeError):
+            return None
+
+    try:
+        result = subprocess.run(
+            ["gh", "pr", "view", pr_number, "--json", "headRefOid", "--jq", ".headRefOid"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+
+    if result.returncode != 0:
+        return None
+
+    return result.stdout.strip() or None
+
+
+def list_pr_files_api(pr_number: str, repository: str, token: str) -> list[str] | None:
+    """
+    List files changed in a PR via the GitHub REST API.
+
+    Calls the endpoint directly instead of forking the gh CLI, which spends
+    most of its time on process start-up and auth.
+
+    Args:
+        pr_number: Pull request number
+        repository: owner/name (GITHUB_REPOSITORY)
+        token: GitHub token
+
+    Returns:
+        Changed file paths, or None if the API call failed
+    """
+    url = f"{GITHUB_API_URL}/repos/{repository}/pulls/{pr_number}/files?per_page=100"
+
+    files = []
+    try:
+        while url:
+            with _api_get(url, token) as response:
+                files.extend(entry["filename"] for entry in json.loads(response.read()))
+                match = NEXT_LINK_RE.search(response.headers.get("Link", ""))
+                url = match.group(1) if match else None
+    except (urllib.error.URLError, TimeoutError, ValueError, KeyError):
+        return None
+
+    return files
+
+
+def list_pr_files_gh(pr_number: str) -> list[str] | None:
+    """
+    List files changed in a PR via the gh CLI.
+
+    Args:
+        pr_number: Pull request number
+
+    Returns:
+        Changed file paths, or None if gh failed
+    """
+    result = subprocess.run(
+        ["gh", "pr", "diff", pr_number, "--name-only"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    if result.returncode != 0:
+        return None
+
+    return result.stdout.strip().split("\n")
+
+
 def main():
     if len(sys.argv) < 2:
         print("Error: PR number not provided.", file=sys.stderr)
@@ -19,27 +225,29 @@ def main():
     pr_number = sys.argv[1]
 
     # Check for GITHUB_TOKEN
-    import os
-    if not os.environ.get("GITHUB_TOKEN"):
+    token = os.environ.get("GITHUB_TOKEN")
+    if not token:
         print("Error: GITHUB_TOKEN not set", file=sys.stderr)
         sys.exit(1)
 
     try:
-        # Get modified files from PR
-        result = subprocess.run(
-            ["gh", "pr", "diff", pr_number, "--name-only"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        # Get modified files from PR: local checkout first, then the REST
+        # API inside Actions, gh elsewhere
+        files = list_pr_files_git(pr_number)
+        if files is None:
+            repository = os.environ.get("GITHUB_REPOSITORY")
+            if repository:
+                files = list_pr_files_api(pr_number, repository, token)
+            else:
+                files = list_pr_files_gh(pr_number)
 
-        if result.returncode != 0:
+        if files is None:
             print("", end="")  # Empty output
             return
 
         # Extract skill names from skills/* paths
         skills = set()
-        for line in result.stdout.strip().split("\n"):
+        for line in files:
             if line.startswith("skills/"):
                 skill_name = line.split("/")[1]
                 if skill_name:
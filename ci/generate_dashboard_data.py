@@ -6,10 +6,81 @@ This is a pure function - no side effects.
 """
 
 import json
+import marshal
+import mmap
+import os
 import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 
+VALID_RATINGS = frozenset(("vague", "regular", "good", "outstanding"))
+NUMERIC_RATINGS = {"0": "vague", "1": "regular", "2": "good", "3": "outstanding"}
+# Every already-clean spelling mapped straight to its normalized rating
+_NORM_MAP = {**{rating: rating for rating in VALID_RATINGS}, **NUMERIC_RATINGS}
+
+# YYYYMMDD-HHMMSS stamp embedded in history file names
+FILE_STAMP_RE = re.compile(r'(\d{8}-\d{6})')
+
+# A per-skill history file names one of these near its start; anything else
+# under history_dir (e.g. run metadata.json) is skipped before parsing
+HISTORY_MARKERS = (b'"skill"', b'"results"')
+HISTORY_HEAD_BYTES = 4096
+
+# History files at least this large are decoded straight from a memory map
+MMAP_MIN_BYTES = 64 * 1024
+
+# Model-name substring -> provider, for history files that omit the provider
+PROVIDER_HINTS = (('sonnet', 'copilot'), ('gpt', 'codex'))
+
+# Small, heavily repeated skill-row values shared as one str object each
+INTERNED_FIELDS = ('skill_name', 'provider', 'model', 'timestamp', 'baseline_rating', 'skill_rating', 'improvement')
+
+# Bump when the shape of parsed rows changes, so old caches are discarded
+PARSE_CACHE_VERSION = 1
+
+# Below this many history files, process start-up outweighs parallel parsing
+PARALLEL_PARSE_MIN = 16
+
+# Dashboard JSON is fetched by the page, not read by people: no indentation
+# (which also keeps the stdlib C encoder fast path) and raw UTF-8
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+
+def _dump_json(obj) -> bytes:
+    """Serialize obj as compact UTF-8 JSON bytes."""
+    return _JSON_ENCODER.encode(obj).encode('utf-8')
+
+
+def _write_json_stream(path: Path, document: dict) -> None:
+    """
+    Write a top-level JSON object, streaming its list values item by item.
+
+    Produces the same bytes as _dump_json(document), but only one list item
+    is held as serialized text at a time, so the whole aggregate never exists
+    as one giant string. Each item still goes through the C encoder.
+    """
+    with open(path, 'wb', buffering=1 << 16) as fp:
+        separator = b'{'
+        for key, value in document.items():
+            fp.write(separator + _dump_json(key) + b':')
+            separator = b','
+            if isinstance(value, list):
+                fp.write(b'[')
+                for index, item in enumerate(value):
+                    if index:
+                        fp.write(b',')
+                    fp.write(_dump_json(item))
+                fp.write(b']')
+            else:
+                fp.write(_dump_json(value))
+        fp.write(b'}' if document else b'{}')
+
+
 def extract_judgment_reasoning(judgment: dict) -> str:
     """
     Extract judgment reasoning with code examples.
@@ -53,20 +124,20 @@ def extract_code_from_test_results(test_results: list, provider: str) -> tuple[s
     after_parts = []
 
     for test in test_results:
-        # Extract before code (baseline)
-        baseline = test.get('baseline', {})
-        before_response = baseline.get('response_full', '')
-        if before_response:
-            before_parts.append(f"// Test: {test.get('name', 'unknown')}\n{before_response}")
+        before_response = test.get('baseline', {}).get('response_full', '')
+        after_response = test.get('skill', {}).get('response_full', '')
+        if not (before_response or after_response):
+            continue
 
-        # Extract after code (skill)
-        skill = test.get('skill', {})
-        after_response = skill.get('response_full', '')
+        # Header formatted once per test and shared by both sides
+        header = f"// Test: {test.get('name', 'unknown')}\n"
+        if before_response:
+            before_parts.append(header + before_response)
         if after_response:
-            after_parts.append(f"// Test: {test.get('name', 'unknown')}\n{after_response}")
+            after_parts.append(header + after_response)
 
-    before_code = "\n\n".join(before_parts) if before_parts else "// No code generated"
-    after_code = "\n\n".join(after_parts) if after_parts else "// No code generated"
+    before_code = "\n\n".join(before_parts) or "// No code generated"
+    after_code = "\n\n".join(after_parts) or "// No code generated"
 
     return before_code, after_code
 
@@ -84,40 +155,52 @@ def normalize_rating(rating: str) -> str:
     if not rating:
         return "vague"
 
-    rating = str(rating).lower().strip()
+    # Already-normalized input (the common case) skips lower()/strip()
+    if isinstance(rating, str) and rating in _NORM_MAP:
+        return _NORM_MAP[rating]
 
-    valid_ratings = ["vague", "regular", "good", "outstanding"]
-    if rating in valid_ratings:
-        return rating
+    return _normalize_rating_text(str(rating))
 
-    # Map numeric values
-    if rating in ["0", "1", "2", "3"]:
-        mapping = {"0": "vague", "1": "regular", "2": "good", "3": "outstanding"}
-        return mapping[rating]
 
-    return "vague"
+@lru_cache(maxsize=64)
+def _normalize_rating_text(rating: str) -> str:
+    # Judges emit a handful of distinct spellings, so results are memoized
+    return _NORM_MAP.get(rating.lower().strip(), "vague")
 
 
 def _normalize_timestamp(timestamp: str) -> str:
     """
     Normalize timestamp to ISO format (YYYY-MM-DDTHH:MM:SS).
+
+    Accepted spellings are fixed-layout, so they are recognized by length
+    and separator positions rather than regex matching:
+    YYYY-MM-DDTHH:MM:SS[Z], YYYYMMDD-HHMMSS and YYYY-MM-DDTHH-MM-SS.
+    Anything else is returned unchanged.
     """
     if not timestamp:
         return ''
 
-    iso_match = re.match(r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(Z)?$', timestamp)
-    if iso_match:
-        return f"{iso_match.group(1)}-{iso_match.group(2)}-{iso_match.group(3)}T{iso_match.group(4)}:{iso_match.group(5)}:{iso_match.group(6)}"
+    ts = timestamp
+    length = len(ts)
 
-    compact_match = re.match(r'^(\d{4})(\d{2})(\d{2})-(\d{2})(\d{2})(\d{2})$', timestamp)
-    if compact_match:
-        return f"{compact_match.group(1)}-{compact_match.group(2)}-{compact_match.group(3)}T{compact_match.group(4)}:{compact_match.group(5)}:{compact_match.group(6)}"
+    # YYYYMMDD-HHMMSS
+    if length == 15:
+        if ts[8] == '-' and (ts[:8] + ts[9:]).isdecimal():
+            return f"{ts[0:4]}-{ts[4:6]}-{ts[6:8]}T{ts[9:11]}:{ts[11:13]}:{ts[13:15]}"
+        return ts
 
-    dashed_match = re.match(r'^(\d{4})-(\d{2})-(\d{2})T(\d{2})-(\d{2})-(\d{2})$', timestamp)
-    if dashed_match:
-        return f"{dashed_match.group(1)}-{dashed_match.group(2)}-{dashed_match.group(3)}T{dashed_match.group(4)}:{dashed_match.group(5)}:{dashed_match.group(6)}"
+    # YYYY-MM-DDTHH:MM:SS, optional Z; YYYY-MM-DDTHH-MM-SS (no Z)
+    if length == 19 or (length == 20 and ts[19] == 'Z'):
+        sep = ts[13]
+        if (
+            (sep == ':' or (sep == '-' and length == 19))
+            and ts[16] == sep
+            and ts[4] == '-' and ts[7] == '-' and ts[10] == 'T'
+            and (ts[0:4] + ts[5:7] + ts[8:10] + ts[11:13] + ts[14:16] + ts[17:19]).isdecimal()
+        ):
+            return f"{ts[0:10]}T{ts[11:13]}:{ts[14:16]}:{ts[17:19]}"
 
-    return timestamp
+    return ts
 
 
 def _benchmark_id_from_parts(provider: str, model: str, timestamp: str, fallback_stamp: str | None) -> str:
@@ -133,12 +216,189 @@ def _benchmark_id_from_parts(provider: str, model: str, timestamp: str, fallback
     return f"{provider}-{safe_model}-{stamp or 'unknown'}"
 
 
-def collect_all_benchmarks(history_dir: Path) -> list[dict]:
+def _parse_history_file(skill_file: Path) -> tuple | None:
+    """
+    Read one per-skill history file into its skill row.
+
+    Pure apart from the read, so files can be parsed concurrently.
+
+    Args:
+        skill_file: Per-skill history JSON file
+
+    Returns:
+        (key, benchmark_id, timestamp, provider, model, skill_data), or None
+        if the file is not a history file or cannot be parsed
+    """
+    try:
+        with skill_file.open('rb') as fp:
+            if os.fstat(fp.fileno()).st_size >= MMAP_MIN_BYTES:
+                # Large files (full LLM responses): decode from the page
+                # cache instead of first copying the file into a bytes object
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if not any(marker in mm[:HISTORY_HEAD_BYTES] for marker in HISTORY_MARKERS):
+                        return None
+                    data = json.loads(str(mm, 'utf-8'))
+            else:
+                head = fp.read(HISTORY_HEAD_BYTES)
+                if not any(marker in head for marker in HISTORY_MARKERS):
+                    return None
+                # Parse the bytes directly: json detects UTF-8 itself, so no
+                # separate locale-dependent text decode is needed
+                data = json.loads(head + fp.read())
+    except Exception:
+        return None
+
+    skill_name = data.get('skill', skill_file.parent.name)
+    model = data.get('model', 'unknown')
+    provider = data.get('provider', 'unknown')
+    timestamp = _normalize_timestamp(data.get('timestamp', ''))
+
+    if provider == 'unknown':
+        model_lower = str(model).lower()
+        for token, hinted_provider in PROVIDER_HINTS:
+            if token in model_lower:
+                provider = hinted_provider
+                break
+
+    # The file-name stamp only matters when the payload has no timestamp
+    fallback_stamp = None
+    if not timestamp:
+        match = FILE_STAMP_RE.search(skill_file.stem)
+        if match:
+            fallback_stamp = match.group(1)
+
+    key = (provider, model, timestamp or fallback_stamp or 'unknown')
+    benchmark_id = _benchmark_id_from_parts(provider, model, timestamp, fallback_stamp)
+
+    judgment = data.get('judgment', {})
+    test_results = data.get('results', [])
+    before_code, after_code = extract_code_from_test_results(test_results, provider)
+
+    overall_better = judgment.get('overall_better') if judgment else None
+    if overall_better in ('A', 'B', 'Equal'):
+        if overall_better == 'B':
+            improvement = 'yes'
+        elif overall_better == 'A':
+            improvement = 'no'
+        else:
+            improvement = 'neutral'
+    else:
+        improvement = data.get('improvement')
+        if isinstance(improvement, (int, float)):
+            improvement = 'yes' if improvement > 0 else ('no' if improvement < 0 else 'neutral')
+        elif improvement is None:
+            improvement = 'neutral'
+
+    skill_data = {
+        'skill_name': skill_name,
+        'skill_version': data.get('skill_version', '1.0.0'),
+        'provider': provider,
+        'model': model,
+        'timestamp': timestamp,
+        'baseline_rating': normalize_rating(judgment.get('option_a_rating', data.get('baseline_rating', ''))),
+        'skill_rating': normalize_rating(judgment.get('option_b_rating', data.get('skill_rating', ''))),
+        'improvement': improvement,
+        'reasoning': extract_judgment_reasoning(judgment) if judgment else 'No reasoning provided',
+        'before_code': before_code,
+        'after_code': after_code,
+        'judgment': judgment,
+        'judge_error': data.get('judge_error', False),
+        'tests': [
+            {
+                'name': t.get('name', 'unknown'),
+                'input': t.get('input', ''),
+                'expected': t.get('expected', {}),
+                'baseline_response': t.get('baseline', {}).get('response_full', ''),
+                'skill_response': t.get('skill', {}).get('response_full', '')
+            }
+            for t in test_results
+        ]
+    }
+    return key, benchmark_id, timestamp, provider, model, skill_data
+
+
+def _iter_history_files(root: str):
+    """
+    Yield per-skill history file paths under root.
+
+    os.scandir walk in the same order as Path.glob('**/*.json') (a
+    directory's files, then its subdirectories depth-first), minus the
+    Path allocation and stat calls for every entry; summary-* files are
+    filtered here.
+    """
+    try:
+        with os.scandir(root) as entries:
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith('.json') and not entry.name.startswith('summary-'):
+                    yield Path(entry.path)
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from _iter_history_files(subdir)
+
+
+def load_parse_cache(cache_file: Path) -> dict:
+    """
+    Load parsed history rows cached by a previous run.
+
+    marshal handles the plain row tuples/dicts faster than pickle; its
+    format is tied to the Python version, so an unreadable, foreign or
+    outdated cache is simply discarded.
+
+    Args:
+        cache_file: Cache path
+
+    Returns:
+        Mapping of (path, mtime_ns, size) -> parsed row (or None)
+    """
+    try:
+        version, cache = marshal.loads(cache_file.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    if version != PARSE_CACHE_VERSION or not isinstance(cache, dict):
+        return {}
+    return cache
+
+
+def save_parse_cache(cache_file: Path, cache: dict) -> None:
+    """Persist parsed rows; a failed write only costs the next run a reparse."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(marshal.dumps((PARSE_CACHE_VERSION, cache)))
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not write parse cache {cache_file}: {e}")
+
+
+def _parse_history_files(skill_files: list[Path]) -> list:
+    """
+    Parse history files, in order.
+
+    JSON decoding holds the GIL, so larger batches are parsed on a process
+    pool; small ones stay on a thread pool to skip process start-up.
+    """
+    if len(skill_files) >= PARALLEL_PARSE_MIN:
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(_parse_history_file, skill_files, chunksize=8))
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_parse_history_file, skill_files))
+
+
+def collect_all_benchmarks(history_dir: Path, cache_file: Path | None = None) -> list[dict]:
     """
     Collect all benchmark data from a directory of per-skill history files.
 
+    Files are parsed in parallel (see _parse_history_files) and merged in
+    discovery order on the calling thread. With a cache file, files whose
+    (path, mtime, size) are unchanged since the last run are not reparsed.
+
     Args:
         history_dir: Directory containing per-skill history JSON files
+        cache_file: Optional read-through parse cache
 
     Returns:
         List of structured benchmark data
@@ -146,108 +406,133 @@ def collect_all_benchmarks(history_dir: Path) -> list[dict]:
     if not history_dir.exists():
         return []
 
-    benchmarks_map: dict[tuple[str, str, str], dict] = {}
+    skill_files = list(_iter_history_files(str(history_dir)))
 
-    for skill_file in history_dir.glob('**/*.json'):
-        if skill_file.name.startswith("summary-"):
-            continue
-        try:
-            data = json.loads(skill_file.read_text())
-        except Exception:
-            continue
+    if cache_file:
+        cache = load_parse_cache(cache_file)
+        keys = []
+        for skill_file in skill_files:
+            st = skill_file.stat()
+            keys.append((str(skill_file), st.st_mtime_ns, st.st_size))
 
-        skill_name = data.get('skill', skill_file.parent.name)
-        model = data.get('model', 'unknown')
-        provider = data.get('provider', 'unknown')
-        timestamp = _normalize_timestamp(data.get('timestamp', ''))
+        misses = [f for f, key in zip(skill_files, keys) if key not in cache]
+        fresh = dict(zip(misses, _parse_history_files(misses)))
+        parsed = [fresh[f] if f in fresh else cache[key] for f, key in zip(skill_files, keys)]
 
-        if provider == 'unknown':
-            if 'sonnet' in str(model).lower():
-                provider = 'copilot'
-            elif 'gpt' in str(model).lower():
-                provider = 'codex'
+        # Only entries for files that still exist are kept
+        save_parse_cache(cache_file, dict(zip(keys, parsed)))
+    else:
+        parsed = _parse_history_files(skill_files)
 
-        fallback_stamp = None
-        match = re.search(r'(\d{8}-\d{6})', skill_file.stem)
-        if match:
-            fallback_stamp = match.group(1)
+    # No get-then-insert branch per row; benchmark dicts are built once at the end
+    skills_by_key: defaultdict[tuple[str, str, str], list] = defaultdict(list)
+    meta_by_key: dict[tuple[str, str, str], tuple] = {}
 
-        key = (provider, model, timestamp or fallback_stamp or 'unknown')
-        benchmark_id = _benchmark_id_from_parts(provider, model, timestamp, fallback_stamp)
-
-        benchmark = benchmarks_map.get(key)
-        if not benchmark:
-            benchmark = {
-                'benchmark_id': benchmark_id,
-                'timestamp': timestamp,
-                'provider': provider,
-                'model': model,
-                'skills': []
-            }
-            benchmarks_map[key] = benchmark
-
-        judgment = data.get('judgment', {})
-        test_results = data.get('results', [])
-        before_code, after_code = extract_code_from_test_results(test_results, provider)
-
-        overall_better = judgment.get('overall_better') if judgment else None
-        if overall_better in ('A', 'B', 'Equal'):
-            if overall_better == 'B':
-                improvement = 'yes'
-            elif overall_better == 'A':
-                improvement = 'no'
-            else:
-                improvement = 'neutral'
-        else:
-            improvement = data.get('improvement')
-            if isinstance(improvement, (int, float)):
-                improvement = 'yes' if improvement > 0 else ('no' if improvement < 0 else 'neutral')
-            elif improvement is None:
-                improvement = 'neutral'
-
-        skill_data = {
-            'skill_name': skill_name,
-            'skill_version': data.get('skill_version', '1.0.0'),
+    for row in parsed:
+        if row is None:
+            continue
+        key, benchmark_id, timestamp, provider, model, skill_data = row
+        # Interned here, not in _parse_history_file: strings unpickled from
+        # a worker process are fresh copies whatever the worker did
+        for field in INTERNED_FIELDS:
+            value = skill_data[field]
+            if type(value) is str:
+                skill_data[field] = sys.intern(value)
+        skills_by_key[key].append(skill_data)
+        meta_by_key.setdefault(key, (benchmark_id, timestamp, provider, model))
+
+    all_data = [
+        {
+            'benchmark_id': benchmark_id,
+            'timestamp': timestamp,
             'provider': provider,
             'model': model,
-            'timestamp': timestamp,
-            'baseline_rating': normalize_rating(judgment.get('option_a_rating', data.get('baseline_rating', ''))),
-            'skill_rating': normalize_rating(judgment.get('option_b_rating', data.get('skill_rating', ''))),
-            'improvement': improvement,
-            'reasoning': extract_judgment_reasoning(judgment) if judgment else 'No reasoning provided',
-            'before_code': before_code,
-            'after_code': after_code,
-            'judgment': judgment,
-            'judge_error': data.get('judge_error', False),
-            'tests': [
-                {
-                    'name': t.get('name', 'unknown'),
-                    'input': t.get('input', ''),
-                    'expected': t.get('expected', {}),
-                    'baseline_response': t.get('baseline', {}).get('response_full', ''),
-                    'skill_response': t.get('skill', {}).get('response_full', '')
-                }
-                for t in test_results
-            ]
+            'skills': skills_by_key[key]
         }
-        benchmark['skills'].append(skill_data)
-
-    all_data = list(benchmarks_map.values())
-    all_data.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        for key, (benchmark_id, timestamp, provider, model) in meta_by_key.items()
+    ]
+    # Every benchmark dict above carries a (normalized) timestamp
+    all_data.sort(key=itemgetter('timestamp'), reverse=True)
     return all_data
 
 
 def _write_per_run_data(output_dir: Path, benchmarks: list[dict]) -> None:
     """
     Write per-run data.json for each benchmark.
+
+    Runs are serialized and written on a thread pool so file I/O overlaps.
     """
-    for benchmark in benchmarks:
-        benchmark_id = benchmark.get("benchmark_id", "unknown")
-        per_run = build_aggregated_data([benchmark])
-        output_file = output_dir / "data" / benchmark_id / "data.json"
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(per_run, f, indent=2)
+    data_dir = output_dir / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    def write_one(benchmark: dict) -> None:
+        per_run = _build_single_aggregated(benchmark)
+        output_file = data_dir / benchmark.get("benchmark_id", "unknown") / "data.json"
+        # Parents exist already: a single mkdir per run directory
+        output_file.parent.mkdir(exist_ok=True)
+        _write_if_changed(output_file, _dump_json(per_run))
+
+    # Runs sharing an id overwrite the same file; keep the last, as a
+    # sequential loop would, so concurrent writers never race on one path
+    by_id = {benchmark.get("benchmark_id", "unknown"): benchmark for benchmark in benchmarks}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # list() re-raises the first write error, if any
+        list(executor.map(write_one, by_id.values()))
+
+
+def _build_single_aggregated(benchmark: dict) -> dict:
+    """
+    Same result as build_aggregated_data([benchmark]), in one pass.
+
+    With a single run there is one model, so the leaderboard has at most one
+    row and "latest per model+skill" is simply the first row per skill name.
+    """
+    model = benchmark.get('model', 'unknown')
+    latest_by_skill: dict[str, dict] = {}
+    for skill in benchmark.get('skills', []):
+        latest_by_skill.setdefault(skill.get('skill_name', 'unknown'), skill)
+
+    leaderboard = []
+    if latest_by_skill:
+        total_tested = len(latest_by_skill)
+        improvements = sum(1 for skill in latest_by_skill.values() if skill.get('improvement') == 'yes')
+        leaderboard.append({
+            'model': model,
+            'provider': next(iter(latest_by_skill.values())).get('provider', 'unknown'),
+            'total_tested': total_tested,
+            'improvements': improvements,
+            'improvement_rate': round((improvements / total_tested * 100), 1),
+        })
+
+    return {
+        'benchmarks': [benchmark],
+        'summary': {
+            'total_benchmarks': 1,
+            'leaderboard': leaderboard
+        },
+        'unique_skills': sorted(latest_by_skill),
+        'provider_models': [(benchmark.get('provider', ''), benchmark.get('model', ''))]
+    }
+
+
+def _write_if_changed(path: Path, content: bytes) -> bool:
+    """
+    Write content unless the file already holds identical bytes.
+
+    Keeps mtimes stable for unchanged runs and skips the write entirely.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        st = path.stat()
+        if st.st_size == len(content) and path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(content)
+    return True
 
 
 def build_aggregated_data(benchmarks: list[dict]) -> dict:
@@ -263,47 +548,41 @@ def build_aggregated_data(benchmarks: list[dict]) -> dict:
     if not benchmarks:
         return {'benchmarks': [], 'summary': {}}
 
-    # Collect all skills with unique names
+    # Single pass: unique names, provider/model pairs, and the per-model
+    # leaderboard counts over the latest run per Model + Skill
     skill_names = set()
     provider_models = set()
+    seen_model_skills: set[tuple[str, str]] = set()
+    model_stats: dict[str, dict] = {}
 
     for benchmark in benchmarks:
-        for skill in benchmark.get('skills', []):
-            skill_names.add(skill.get('skill_name', 'unknown'))
         provider_models.add((benchmark.get('provider', ''), benchmark.get('model', '')))
-
-    # 1. Track latest run per Model + Skill
-    model_skill_latest: dict[tuple[str, str], dict] = {}
-    
-    for benchmark in benchmarks:
         model = benchmark.get('model', 'unknown')
         for skill in benchmark.get('skills', []):
             skill_name = skill.get('skill_name', 'unknown')
-            key = (model, skill_name)
-            
+            skill_names.add(skill_name)
+
             # Since benchmarks are sorted by timestamp desc in collect_all_benchmarks,
             # the first one we see for a key is the latest.
-            if key not in model_skill_latest:
-                model_skill_latest[key] = skill
-
-    # 2. Group by model to generate leaderboard
-    model_stats: dict[str, dict] = {}
-    for (model, skill_name), skill_data in model_skill_latest.items():
-        if model not in model_stats:
-            model_stats[model] = {
-                'model': model,
-                'provider': skill_data.get('provider', 'unknown'),
-                'total_tested': 0,
-                'improvements': 0,
-                'improvement_rate': 0
-            }
-        
-        stats = model_stats[model]
-        stats['total_tested'] += 1
-        if skill_data.get('improvement') == 'yes':
-            stats['improvements'] += 1
+            key = (model, skill_name)
+            if key in seen_model_skills:
+                continue
+            seen_model_skills.add(key)
+
+            stats = model_stats.get(model)
+            if stats is None:
+                stats = model_stats[model] = {
+                    'model': model,
+                    'provider': skill.get('provider', 'unknown'),
+                    'total_tested': 0,
+                    'improvements': 0,
+                    'improvement_rate': 0
+                }
+            stats['total_tested'] += 1
+            if skill.get('improvement') == 'yes':
+                stats['improvements'] += 1
 
-    # 3. Finalize leaderboard
+    # Finalize leaderboard
     leaderboard = []
     for model_name, stats in model_stats.items():
         if stats['total_tested'] > 0:
@@ -313,7 +592,7 @@ def build_aggregated_data(benchmarks: list[dict]) -> dict:
     # Sort leaderboard by rate desc, then total tested desc
     leaderboard.sort(key=lambda x: (x['improvement_rate'], x['total_tested']), reverse=True)
 
-    # 4. Global summary (still useful for general totals)
+    # Global summary (still useful for general totals)
     total_benchmarks = len(benchmarks)
 
     return {
@@ -322,12 +601,14 @@ def build_aggregated_data(benchmarks: list[dict]) -> dict:
             'total_benchmarks': total_benchmarks,
             'leaderboard': leaderboard
         },
-        'unique_skills': sorted(list(skill_names)),
-        'provider_models': sorted(list(provider_models))
+        # sorted() accepts the sets directly; lexical order keeps the files
+        # byte-stable between runs (see _write_if_changed)
+        'unique_skills': sorted(skill_names),
+        'provider_models': sorted(provider_models)
     }
 
 
-def generate_dashboard_data(history_dir: Path, output_dir: Path) -> bool:
+def generate_dashboard_data(history_dir: Path, output_dir: Path, cache_file: Path | None = None) -> bool:
     """
     Main function: Generate dashboard data from benchmark files.
 
@@ -336,25 +617,25 @@ def generate_dashboard_data(history_dir: Path, output_dir: Path) -> bool:
     Args:
         history_dir: Directory containing per-skill history JSON files
         output_dir: Output directory for benchmarks.json and data/*
+        cache_file: Optional parse cache for incremental rebuilds
 
     Returns:
         True if successful, False otherwise
     """
     try:
         # Collect all benchmarks
-        benchmarks = collect_all_benchmarks(history_dir)
+        benchmarks = collect_all_benchmarks(history_dir, cache_file)
 
         # Build aggregated data
         aggregated = build_aggregated_data(benchmarks)
 
-        # Write per-run data.json files
+        # Create the output tree once, then write per-run data.json files
+        output_dir.mkdir(parents=True, exist_ok=True)
         _write_per_run_data(output_dir, benchmarks)
 
-        # Write output
-        output_dir.mkdir(parents=True, exist_ok=True)
+        # Write output, streamed per benchmark through a 64 KiB buffer
         output_file = output_dir / "benchmarks.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(aggregated, f, indent=2)
+        _write_json_stream(output_file, aggregated)
 
         print(f"Generated {output_file}")
         print(f"  Benchmarks: {aggregated['summary'].get('total_benchmarks', 0)}")
@@ -379,6 +660,7 @@ if __name__ == "__main__":
         results_dir = Path(sys.argv[1])
     if len(sys.argv) > 2:
         output_dir = Path(sys.argv[2])
+    cache_file = Path(sys.argv[3]) if len(sys.argv) > 3 else None
 
-    success = generate_dashboard_data(results_dir, output_dir)
+    success = generate_dashboard_data(results_dir, output_dir, cache_file)
     sys.exit(0 if success else 1)
@@ -12,8 +12,33 @@ import sys
 from pathlib import Path
 
 
+CONFIG_PATH = Path("ci/config.yaml")
+
+
 def generate_base_matrix(filter_provider: str = "all") -> dict:
-    """Generate base matrix from config."""
+    """
+    Generate base matrix from config.
+
+    Runs matrix_generator in-process, skipping an interpreter start-up, uv
+    dependency resolution and a JSON round trip through stdout. Only when
+    this interpreter lacks PyYAML does it fall back to the uv subprocess.
+    """
+    try:
+        import matrix_generator
+    except ImportError:
+        return _generate_base_matrix_uv(filter_provider)
+
+    try:
+        config = matrix_generator.load_config_cached(CONFIG_PATH)
+    except ValueError as e:
+        print(f"Error generating matrix: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    return matrix_generator.generate_matrix(config, filter_provider)
+
+
+def _generate_base_matrix_uv(filter_provider: str) -> dict:
+    """Generate base matrix via `uv run --with pyyaml` in a subprocess."""
     result = subprocess.run(
         ["uv", "run", "--with", "pyyaml", "ci/matrix_generator.py", "--filter-provider", filter_provider],
         capture_output=True,
@@ -59,19 +84,10 @@ def main():
         base_matrix = generate_base_matrix("all")
         matrix = expand_with_override_skills(base_matrix, override_skills)
     else:
-        # Auto-detect from PR
+        # Auto-detect from PR (in-process, same as orchestrate_evaluations.py --matrix-only)
         print(f"Auto-detecting changed skills in PR #{pr_number}", file=sys.stderr)
-        result = subprocess.run(
-            ["python3", "ci/orchestrate_evaluations.py", str(pr_number), "--matrix-only", "--filter-provider", "all"],
-            capture_output=True,
-            text=True,
-        )
-        
-        if result.returncode != 0:
-            print(f"Error detecting changes: {result.stderr}", file=sys.stderr)
-            sys.exit(1)
-        
-        matrix = json.loads(result.stdout)
+        from orchestrate_evaluations import build_matrix
+        matrix = build_matrix(int(pr_number), filter_provider="all")
 
     # Output matrix
     print(json.dumps(matrix))
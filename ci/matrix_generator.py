@@ -17,9 +17,19 @@ import yaml
 import json
 import sys
 import argparse
+import hashlib
+import marshal
+import os
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Any
 
+# libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 def validate_provider_config(provider_name: str, config: Dict[str, Any]) -> List[str]:
     """Validate provider configuration structure."""
@@ -38,6 +48,71 @@ def validate_provider_config(provider_name: str, config: Dict[str, Any]) -> List
     return errors
 
 
+def load_config(config_path: Path) -> Dict[str, Any]:
+    """
+    Read the provider configuration mapping.
+
+    Raises:
+        ValueError: With a printable message if the file is missing,
+            unparsable, or not a mapping
+    """
+    if not config_path.exists():
+        raise ValueError(f"Configuration file not found: {config_path}")
+
+    try:
+        with open(config_path, 'r') as f:
+            config = yaml.load(f, Loader=SafeLoader)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML in {config_path}: {e}") from e
+    except Exception as e:
+        raise ValueError(f"Could not read {config_path}: {e}") from e
+
+    if not isinstance(config, dict):
+        raise ValueError("Configuration must be a dictionary")
+
+    return config
+
+
+def load_config_cached(config_path: Path) -> Dict[str, Any]:
+    """
+    load_config, memoized on disk by the file's path, mtime and size.
+
+    The parsed mapping is kept in the temp directory as marshal data (plain
+    dicts/lists/scalars, and unlike pickle it cannot run code on load), so
+    repeated matrix jobs on one machine skip YAML parsing entirely. Any
+    cache problem falls back to a normal load.
+
+    Raises:
+        ValueError: As load_config
+    """
+    try:
+        st = config_path.stat()
+    except OSError:
+        return load_config(config_path)
+
+    path_hash = hashlib.sha1(str(config_path.resolve()).encode()).hexdigest()[:12]
+    cache_file = Path(tempfile.gettempdir()) / f"ci_config_{path_hash}_{st.st_mtime_ns}_{st.st_size}.marshal"
+
+    try:
+        config = marshal.loads(cache_file.read_bytes())
+        if isinstance(config, dict):
+            return config
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    config = load_config(config_path)
+
+    # Write-then-rename so a concurrent job never reads a partial cache
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_bytes(marshal.dumps(config))
+        os.replace(tmp_file, cache_file)
+    except (OSError, ValueError):
+        tmp_file.unlink(missing_ok=True)
+
+    return config
+
+
 def generate_matrix(config: Dict[str, Any], filter_provider: str = "all") -> Dict[str, List[Dict[str, str]]]:
     """
     Generate evaluation matrix from configuration.
@@ -45,7 +120,7 @@ def generate_matrix(config: Dict[str, Any], filter_provider: str = "all") -> Dic
     Returns matrix suitable for CI parallelization.
     Each item contains provider, model, and extra args.
     """
-    matrix = {"include": []}
+    valid_providers = []
     
     for provider_name, provider_config in config.items():
         # Skip disabled providers
@@ -64,23 +139,22 @@ def generate_matrix(config: Dict[str, Any], filter_provider: str = "all") -> Dic
                 print(f"  - {error}", file=sys.stderr)
             continue
         
-        # Generate matrix items for each model
-        models = provider_config.get("models", [])
-        for model in models:
-            item = {
+        valid_providers.append((provider_name, provider_config))
+
+    # One matrix item per model, built in a single comprehension.
+    # Provider-specific arguments (e.g. --ollama-cloud) are now handled
+    # implicitly in the adapter, so items carry no extra_args.
+    matrix = {
+        "include": [
+            {
                 "provider": provider_name,
                 "model": model,
                 "display_name": f"{provider_name}/{model}"
             }
-            
-            # Add provider-specific arguments (now handled implicitly in adapter)
-            # extra_args = []
-            # if provider_name == "ollama":
-            #     if not provider_config.get("local", True):
-            #         extra_args.append("--ollama-cloud")
-
-            # item["extra_args"] = " ".join(extra_args)
-            matrix["include"].append(item)
+            for provider_name, provider_config in valid_providers
+            for model in provider_config["models"]
+        ]
+    }
 
     return matrix
 
@@ -109,23 +183,10 @@ def main():
     args = parser.parse_args()
     
     # Read configuration
-    config_path = Path(args.config)
-    if not config_path.exists():
-        print(f"Error: Configuration file not found: {config_path}", file=sys.stderr)
-        sys.exit(1)
-    
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        print(f"Error parsing YAML: {e}", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error reading config: {e}", file=sys.stderr)
-        sys.exit(1)
-    
-    if not isinstance(config, dict):
-        print("Error: Configuration must be a dictionary", file=sys.stderr)
+        config = load_config_cached(Path(args.config))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
     
     # Validate-only mode
@@ -14,10 +14,22 @@ import subprocess
 import sys
 import os
 import json
+import time
 from pathlib import Path
 import argparse
 
 
+# "/test <provider>" command -> provider filter, checked in order
+PROVIDER_COMMANDS = (
+    ("/test copilot", "copilot"),
+    ("/test ollama", "ollama"),
+    ("/test gemini", "gemini"),
+)
+
+# Seconds between checks on running evaluator processes
+POLL_INTERVAL = 0.5
+
+
 def validate_environment():
     """Validate required environment variables."""
     if not os.environ.get("GITHUB_TOKEN"):
@@ -31,9 +43,31 @@ def validate_environment():
 
 
 def detect_changes(pr_number: int) -> str:
-    """Detect modified skills in PR."""
-    if not os.environ.get("GITHUB_TOKEN"):
+    """
+    Detect modified skills in PR.
+
+    The answer only depends on the PR and its head commit, so it is cached
+    in the temp directory under (pr_number, head sha); repeat runs for
+    the same push skip the detect_changes.py process and its paginated
+    file listing. The sha comes from the local checkout when it is the PR,
+    so a cache hit costs no network call; otherwise the PR's head is asked
+    from GitHub. Without a known head sha nothing is cached.
+    """
+    token = os.environ.get("GITHUB_TOKEN")
+    if not token:
         return ""
+
+    from detect_changes import checkout_head_sha, pr_head_sha
+
+    cache_file = None
+    head_sha = checkout_head_sha(str(pr_number)) or pr_head_sha(str(pr_number), token)
+    if head_sha:
+        import tempfile
+        cache_file = Path(tempfile.gettempdir()) / f"detect_changes_{pr_number}_{head_sha}.txt"
+        try:
+            return cache_file.read_text().strip()
+        except OSError:
+            pass
     
     result = subprocess.run(
         ["python3", "ci/detect_changes.py", str(pr_number)],
@@ -42,27 +76,24 @@ def detect_changes(pr_number: int) -> str:
     )
 
     modified_skills = result.stdout.strip()
+
+    # detect_changes.py prints nothing when its lookup fails, so an empty
+    # answer is never cached: it may be an API error rather than "no skills"
+    if cache_file and result.returncode == 0 and modified_skills:
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            tmp_file.write_text(modified_skills)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+
     return modified_skills
 
 
 def generate_matrix(filter_provider: str = "all", skills: str = "") -> list:
     """Generate evaluation matrix from configuration with per-skill jobs."""
-    
-    result = subprocess.run(
-        ["uv", "run", "--with", "pyyaml", "ci/matrix_generator.py", "--filter-provider", filter_provider],
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
-        print(f"Error generating matrix: {result.stderr}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        matrix_data = json.loads(result.stdout)
-    except json.JSONDecodeError:
-        print(f"Error parsing matrix JSON: {result.stdout}", file=sys.stderr)
-        sys.exit(1)
+    from generate_matrix import generate_base_matrix
+    matrix_data = generate_base_matrix(filter_provider)
 
     items = matrix_data.get("include", [])
 
@@ -72,21 +103,18 @@ def generate_matrix(filter_provider: str = "all", skills: str = "") -> list:
 
     # If skills are specified, expand matrix to one item per skill per model
     if skills and skills.strip():
-        skill_list = skills.strip().split()
-        expanded_items = []
-        
-        for item in items:
-            for skill in skill_list:
-                expanded_item = item.copy()
-                expanded_item["skill"] = skill
-                expanded_item["display_name"] = f"{item['display_name']} / {skill}"
-                expanded_items.append(expanded_item)
-        
-        items = expanded_items
+        from generate_matrix import expand_with_override_skills
+        items = expand_with_override_skills(matrix_data, skills.split())["include"]
     
     return items
 
 
+def build_matrix(pr_number: int, filter_provider: str = "all") -> dict:
+    """Matrix for the skills changed in a PR (what --matrix-only prints)."""
+    modified_skills = detect_changes(pr_number)
+    return {"include": generate_matrix(filter_provider, modified_skills)}
+
+
 def run_sequential(items: list, threshold: int = 50):
     """Run evaluations sequentially."""
     print("\n==> Running evaluations sequentially")
@@ -109,91 +137,190 @@ def run_sequential(items: list, threshold: int = 50):
     subprocess.run(["python3", "ci/consolidate_results.py"])
 
 
-def run_parallel_local(items: list, threshold: int = 50):
-    """Run evaluations in parallel locally (one job per skill per model)."""
-    print(f"\n==> Running {len(items)} evaluation(s) in parallel")
+def _group_by_model(items: list) -> list:
+    """
+    Merge per-skill matrix items into one job per provider/model.
 
-    import concurrent.futures
-    
-    def run_single_eval(item):
-        provider = item["provider"]
-        model = item["model"]
-        extra_args = item.get("extra_args", "")
+    The evaluator takes repeated --skill flags and evaluates them
+    concurrently itself, so one process per model pays interpreter start-up,
+    uv environment resolution and adapter setup once instead of per skill.
+    A job with skills None runs --all.
+    """
+    jobs: dict[tuple, dict] = {}
+    for item in items:
+        key = (item["provider"], item["model"], item.get("extra_args", ""))
+        job = jobs.setdefault(key, {
+            "provider": item["provider"],
+            "model": item["model"],
+            "extra_args": item.get("extra_args", ""),
+            "skills": [],
+            "size": 0,
+        })
+        job["size"] += 1
         skill = item.get("skill")
-        
-        display = f"{provider}/{model}" + (f"/{skill}" if skill else "")
-        print(f"[{display}] Starting...")
-        
-        cmd = [
-            "uv",
-            "run",
-            "--project",
-            "tests",
-            "--frozen",
-            "tests/evaluator.py",
-            "--provider",
-            provider,
-            "--model",
-            model,
-            "--threshold",
-            str(threshold),
-            "--judge",
-            "--verbose",
-            "--report",
-        ]
-        
-        if extra_args.strip():
-            cmd.extend(extra_args.split())
-        
-        if skill:
+        if not skill:
+            job["skills"] = None
+        elif job["skills"] is not None and skill not in job["skills"]:
+            job["skills"].append(skill)
+    return list(jobs.values())
+
+
+def _display_name(job: dict) -> str:
+    """provider/model[/skills] label for log lines."""
+    skills = job["skills"]
+    return f"{job['provider']}/{job['model']}" + (f"/{','.join(skills)}" if skills else "")
+
+
+def _evaluation_command(job: dict, threshold: int) -> list:
+    """Evaluator command line for one provider/model job."""
+    extra_args = job["extra_args"]
+
+    cmd = [
+        "uv",
+        "run",
+        "--project",
+        "tests",
+        "--frozen",
+        "tests/evaluator.py",
+        "--provider",
+        job["provider"],
+        "--model",
+        job["model"],
+        "--threshold",
+        str(threshold),
+        "--judge",
+        "--verbose",
+        "--report",
+    ]
+
+    if extra_args.strip():
+        cmd.extend(extra_args.split())
+
+    if job["skills"]:
+        for skill in job["skills"]:
             cmd.extend(["--skill", skill])
-        else:
-            cmd.append("--all")
-        
-        result = subprocess.run(cmd, capture_output=False)
-        
-        return provider, model, skill, result.returncode
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(items), 4)) as executor:
-        futures = {executor.submit(run_single_eval, item): item for item in items}
-        
-        failed_count = 0
-        for future in concurrent.futures.as_completed(futures):
+    else:
+        cmd.append("--all")
+
+    return cmd
+
+
+def _relay_output(process: subprocess.Popen, label: str) -> None:
+    """Echo a child's output line by line, prefixed so parallel logs stay readable."""
+    for line in process.stdout:
+        sys.stdout.write(f"[{label}] {line}")
+        sys.stdout.flush()
+
+
+def run_parallel_local(items: list, threshold: int = 50):
+    """Run evaluations in parallel locally (one evaluator process per model)."""
+    jobs = _group_by_model(items)
+    print(f"\n==> Running {len(items)} evaluation(s) as {len(jobs)} model job(s) in parallel")
+
+    import threading
+
+    # The work happens in child processes, so they are spawned directly and
+    # polled until they exit. Each child's output is piped through a relay
+    # thread that tags every line with its provider/model.
+    max_workers = min(len(jobs), 4)
+    pending = iter(jobs)
+    running: list[tuple[subprocess.Popen, threading.Thread, dict]] = []
+    failed_jobs = 0
+
+    while True:
+        # Keep up to max_workers evaluators running
+        while len(running) < max_workers:
+            job = next(pending, None)
+            if job is None:
+                break
+            print(f"[{_display_name(job)}] Starting...")
             try:
-                provider, model, skill, exit_code = future.result()
-                display = f"{provider}/{model}" + (f"/{skill}" if skill else "")
-                if exit_code == 0:
-                    print(f"✅ [{display}] Completed")
-                else:
-                    print(f"❌ [{display}] Failed (exit code {exit_code})")
-                    failed_count += 1
-            except Exception as e:
+                process = subprocess.Popen(
+                    _evaluation_command(job, threshold),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    env={**os.environ, "PYTHONUNBUFFERED": "1"},
+                )
+            except OSError as e:
                 print(f"❌ Error: {e}")
-                failed_count += 1
+                failed_jobs += 1
+                continue
+            relay = threading.Thread(
+                target=_relay_output, args=(process, f"{job['provider']}/{job['model']}")
+            )
+            relay.start()
+            running.append((process, relay, job))
+
+        if not running:
+            break
+
+        finished = [entry for entry in running if entry[0].poll() is not None]
+        if not finished:
+            time.sleep(POLL_INTERVAL)
+            continue
+        for entry in finished:
+            running.remove(entry)
+            process, relay, job = entry
+            # Drain the rest of its output before reporting the result
+            relay.join()
+            process.stdout.close()
+            if process.returncode == 0:
+                print(f"✅ [{_display_name(job)}] Completed")
+            else:
+                # The evaluator exits non-zero if any of its skills fails,
+                # so failures are known per model job, not per skill
+                print(f"❌ [{_display_name(job)}] Failed (exit code {process.returncode})")
+                failed_jobs += 1
     
-    print(f"\n✓ All evaluation(s) completed ({len(items)-failed_count}/{len(items)} passed)")
+    print(f"\n✓ All model job(s) completed ({len(jobs)-failed_jobs}/{len(jobs)} passed)")
     
-    if failed_count > 0:
-        print(f"⚠ {failed_count} evaluation(s) failed")
+    if failed_jobs > 0:
+        print(f"⚠ {failed_jobs} model job(s) failed")
     
     # Consolidate
     subprocess.run(["python3", "ci/consolidate_results.py"])
 
 
-def parse_command(comment: str) -> tuple:
-    """Parse /test command from comment."""
-    filter_provider = "all"
-    use_parallel = False
+def _discard_dir(path: Path) -> None:
+    """
+    Get a directory out of the way without waiting for it to be deleted.
+
+    The directory is renamed aside (a single metadata update) and removed
+    on a daemon thread while evaluations start, together with any trash
+    an earlier run left behind when it exited before its delete finished.
+    Falls back to a direct rmtree if the rename fails.
+    """
+    import shutil
+    import threading
 
-    if "/test copilot" in comment:
-        filter_provider = "copilot"
-    elif "/test ollama" in comment:
-        filter_provider = "ollama"
-    elif "/test gemini" in comment:
-        filter_provider = "gemini"
+    if path.exists():
+        trash = path.with_name(f".{path.name}.old.{os.getpid()}")
+        try:
+            os.rename(path, trash)
+        except OSError:
+            shutil.rmtree(path)
 
-    if "parallel" in comment:
-        use_parallel = True
+    stale = list(path.parent.glob(f".{path.name}.old.*"))
+    if not stale:
+        return
+
+    def _remove_all():
+        for old in stale:
+            shutil.rmtree(old, ignore_errors=True)
+
+    threading.Thread(target=_remove_all, daemon=True).start()
+
+
+def parse_command(comment: str) -> tuple:
+    """Parse /test command from comment."""
+    filter_provider = next(
+        (provider for command, provider in PROVIDER_COMMANDS if command in comment),
+        "all",
+    )
+    use_parallel = "parallel" in comment
 
     return filter_provider, use_parallel
 
@@ -217,23 +344,23 @@ def main():
     os.environ["COPILOT_GITHUB_TOKEN"] = os.environ.get("GITHUB_TOKEN", "")
     os.environ["GH_TOKEN"] = os.environ.get("GITHUB_TOKEN", "")
 
-    # Detect changes
-    modified_skills = detect_changes(args.pr_number)
-    os.environ["MODIFIED_SKILLS"] = modified_skills
+    # Detect changes and generate the matrix (per-skill jobs if skills detected)
+    matrix = build_matrix(args.pr_number, args.filter_provider)
+    items = matrix["include"]
 
-    # Generate matrix (expand with per-skill jobs if skills detected)
-    items = generate_matrix(args.filter_provider, modified_skills)
-    
     # If matrix-only mode, output JSON and exit
     if args.matrix_only:
-        print(json.dumps({"include": items}))
+        print(json.dumps(matrix))
         sys.exit(0)
 
+    # Detected skills, in detection order, as read by run_evaluation.py
+    os.environ["MODIFIED_SKILLS"] = " ".join(
+        dict.fromkeys(item["skill"] for item in items if "skill" in item)
+    )
+
     # Clean previous results
     results_base = Path("tests/data-history")
-    import shutil
-    if results_base.exists():
-        shutil.rmtree(results_base)
+    _discard_dir(results_base)
     results_base.mkdir(parents=True, exist_ok=True)
 
     # Run evaluations
@@ -5,12 +5,35 @@ Handles operations on the benchmark-history orphan branch.
 Encapsulates git operations behind a clean interface.
 """
 
+import os
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
 
+def _fast_copy(src, dst) -> str:
+    """
+    shutil copy_function that hard-links instead of copying bytes.
+
+    Git replaces work-tree files rather than writing into them, so sharing
+    the inode with the generated output is safe. Falls back to copy2 when
+    linking is not possible (e.g. a different filesystem).
+    """
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        os.unlink(dst)
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
 @dataclass(frozen=True)
 class GitResult:
     """Result of a git operation."""
@@ -46,7 +69,8 @@ class OrphanBranchManager:
             *args: Git command arguments
 
         Returns:
-            GitResult with success status and output
+            GitResult with success status and output (stdout is kept on
+            failure too, e.g. commit's "nothing to commit")
         """
         try:
             result = subprocess.run(
@@ -65,7 +89,8 @@ class OrphanBranchManager:
             else:
                 return GitResult(
                     success=False,
-                    message=result.stderr.strip() if result.stderr else "Command failed"
+                    message=result.stderr.strip() if result.stderr else "Command failed",
+                    output=result.stdout.strip() if result.stdout else None
                 )
         except Exception as e:
             return GitResult(
@@ -112,10 +137,14 @@ class OrphanBranchManager:
         Returns:
             GitResult with success status
         """
-        if not self.branch_exists():
-            return self.create_orphan_branch()
+        # Try the checkout first so the common case is one git call.
+        # --no-guess: never create it from a same-named remote branch;
+        # trailing "--": never treat the name as a path
+        result = self._run_git("checkout", "--no-guess", self.branch_name, "--")
+        if result.success or self.branch_exists():
+            return result
 
-        return self._run_git("checkout", self.branch_name)
+        return self.create_orphan_branch()
 
     def copy_files_to_branch(self, source_dir: Path, dest_dir: Optional[str] = None) -> GitResult:
         """
@@ -132,9 +161,8 @@ class OrphanBranchManager:
         dest.mkdir(parents=True, exist_ok=True)
 
         try:
-            import shutil
             if dest_dir:
-                shutil.copytree(source_dir, dest, dirs_exist_ok=True)
+                shutil.copytree(source_dir, dest, dirs_exist_ok=True, copy_function=_fast_copy)
                 return GitResult(success=True, message=f"Copied files to {dest}")
 
             for item in source_dir.iterdir():
@@ -142,9 +170,9 @@ class OrphanBranchManager:
                 if item.is_dir():
                     if target.exists():
                         shutil.rmtree(target)
-                    shutil.copytree(item, target)
+                    shutil.copytree(item, target, copy_function=_fast_copy)
                 else:
-                    shutil.copy2(item, target)
+                    _fast_copy(item, target)
 
             return GitResult(success=True, message=f"Copied files to {dest}")
         except Exception as e:
@@ -208,11 +236,11 @@ class OrphanBranchManager:
         Returns:
             Tuple of (branch_name, commit_hash)
         """
-        branch_result = self._run_git("rev-parse", "--abbrev-ref", "HEAD")
-        commit_result = self._run_git("rev-parse", "HEAD")
-
-        branch = branch_result.output or "unknown"
-        commit = commit_result.output or "unknown"
+        # One call: --abbrev-ref only applies to the revisions after it,
+        # so this prints the commit hash, then the branch name
+        result = self._run_git("rev-parse", "HEAD", "--abbrev-ref", "HEAD")
+        lines = result.output.splitlines() if result.success and result.output else []
+        commit, branch = (lines + ["unknown", "unknown"])[:2]
 
         return branch, commit
 
@@ -282,7 +310,11 @@ def manage_benchmark_branch(
 
     result = manager.commit("Update benchmark data")
     if not result.success:
-        # Check if nothing to commit
+        # Check if nothing to commit: git says so on stdout, which saves a
+        # status call; otherwise (e.g. localized git) ask status
+        if result.output and "nothing to commit" in result.output:
+            print("No changes to commit")
+            return True
         status_result = manager._run_git("status", "--porcelain")
         if not status_result.output:
             print("No changes to commit")
@@ -12,6 +12,10 @@ import sys
 import re
 
 
+# "/test skill <names>"
+SKILL_OVERRIDE_RE = re.compile(r'/test\s+skill\s+(.+?)(?:\s*$|\s+\S)')
+
+
 def parse_command(comment: str) -> list:
     """Parse /test command and extract skills if specified.
     
@@ -19,7 +23,7 @@ def parse_command(comment: str) -> list:
     """
     
     # Check if /test skill <names> is present
-    match = re.search(r'/test\s+skill\s+(.+?)(?:\s*$|\s+\S)', comment)
+    match = SKILL_OVERRIDE_RE.search(comment)
     
     if match:
         # Extract everything after "/test skill" until end or next word
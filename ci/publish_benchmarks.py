@@ -7,6 +7,7 @@ Coordinates all steps: run evaluation, generate data, create HTML, push to orpha
 """
 
 import argparse
+import os
 import shutil
 import subprocess
 import sys
@@ -26,8 +27,10 @@ def run_benchmark(provider: str, model: str, skill: str | None = None) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    # --frozen: use tests/uv.lock as-is instead of re-resolving the project
+    # on every start, as the other evaluator callers do
     cmd = [
-        "uv", "run", "--project", "tests", "tests/evaluator.py",
+        "uv", "run", "--project", "tests", "--frozen", "tests/evaluator.py",
         "--provider", provider,
         "--model", model,
         "--judge",
@@ -46,26 +49,75 @@ def run_benchmark(provider: str, model: str, skill: str | None = None) -> bool:
     return result.returncode == 0
 
 
-def collect_and_generate(history_dir: Path, output_dir: Path) -> bool:
+def collect_and_generate(history_dir: Path, output_dir: Path, cache_file: Path | None = None) -> bool:
     """
     Collect benchmark data and generate HTML.
 
     Args:
         benchmarks_dir: Directory containing benchmark JSON files
         output_dir: Directory to write generated files
+        cache_file: Optional parse cache for incremental rebuilds
 
     Returns:
         True if successful, False otherwise
     """
     from generate_dashboard_data import generate_dashboard_data
     # Generate aggregated JSON and per-run data.json files
-    if not generate_dashboard_data(history_dir, output_dir):
+    if not generate_dashboard_data(history_dir, output_dir, cache_file):
         print("Error generating dashboard data")
         return False
 
     return True
 
 
+def _sync_tree(source: Path, dest: Path, prune: bool = True) -> None:
+    """
+    Make dest mirror source, copying only files that changed.
+
+    A file is considered unchanged when size and mtime match (copy2
+    preserves mtime), so re-publishing unchanged static assets costs one
+    scandir per directory instead of a full delete-and-copy.
+
+    Args:
+        source: Directory to copy from
+        dest: Directory to update
+        prune: Also delete dest entries missing from source. Off for the
+            output root, which holds generated files alongside the assets.
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    with os.scandir(dest) as entries:
+        existing = {entry.name: entry for entry in entries}
+
+    with os.scandir(source) as entries:
+        for entry in entries:
+            target = dest / entry.name
+            current = existing.pop(entry.name, None)
+
+            if entry.is_dir():
+                if current is not None and not current.is_dir():
+                    os.unlink(target)
+                _sync_tree(Path(entry.path), target)
+                continue
+
+            if current is not None:
+                if current.is_dir(follow_symlinks=False):
+                    shutil.rmtree(target)
+                else:
+                    src_stat = entry.stat()
+                    dest_stat = current.stat()
+                    if (src_stat.st_size == dest_stat.st_size
+                            and src_stat.st_mtime_ns == dest_stat.st_mtime_ns):
+                        continue
+            shutil.copy2(entry.path, target)
+
+    if prune:
+        for name, entry in existing.items():
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
 def push_to_orphan_branch(repo_path: Path, docs_dir: Path, branch_name: str) -> bool:
     """
     Push benchmark files to orphan branch.
@@ -95,6 +147,8 @@ def main() -> int:
     parser.add_argument("--benchmarks-dir", help="Deprecated (unused)")
     parser.add_argument("--history-dir", help="Directory containing per-skill history (default: tests/data-history)")
     parser.add_argument("--output-dir", help="Directory to write generated files")
+    parser.add_argument("--cache-file", type=Path, default=None,
+                        help="Parse cache reused across runs; unchanged history files are not reparsed")
 
     args = parser.parse_args()
 
@@ -128,18 +182,11 @@ def main() -> int:
         print(f"Static site source not found at {source_dir}")
         return 1
 
-    for item in source_dir.iterdir():
-        dest = output_dir / item.name
-        if item.is_dir():
-            if dest.exists():
-                shutil.rmtree(dest)
-            shutil.copytree(item, dest)
-        else:
-            shutil.copy2(item, dest)
+    _sync_tree(source_dir, output_dir, prune=False)
 
     # Step 5: Generate dashboard data files
     print("\nGenerating dashboard data...")
-    if not collect_and_generate(history_dir, output_dir):
+    if not collect_and_generate(history_dir, output_dir, args.cache_file):
         print("Dashboard generation failed")
         return 1
 
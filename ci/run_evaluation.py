@@ -13,6 +13,10 @@ import re
 from pathlib import Path
 
 
+# Evaluator summary line: "[FAIL] N skills failed threshold: ..."
+FAILED_THRESHOLD_RE = re.compile(r'\[FAIL\] (\d+) skills failed threshold')
+
+
 def get_timestamp():
     """
     Get current timestamp for artifact naming.
@@ -52,6 +56,41 @@ def extract_model_name(model: str) -> str:
     return clean
 
 
+def run_streaming(cmd: list[str]) -> tuple[int, int]:
+    """
+    Run a command, echoing its output live and parsing it line by line.
+
+    Nothing is retained beyond the current line, so memory stays bounded
+    regardless of how verbose the evaluator is. The child runs with
+    PYTHONUNBUFFERED=1: writing to a pipe would otherwise make its Python
+    block-buffer stdout and the output would arrive in bursts.
+
+    Args:
+        cmd: Command to execute
+
+    Returns:
+        Tuple of (exit_code, failed_skills)
+    """
+    failed_skills = 0
+
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
+    ) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            match = FAILED_THRESHOLD_RE.search(line)
+            if match:
+                failed_skills = int(match.group(1))
+        exit_code = proc.wait()
+
+    return exit_code, failed_skills
+
+
 def main():
     if len(sys.argv) < 3:
         print("Usage: run_evaluation.py <provider> <model> [threshold] [extra_args]")
@@ -117,13 +156,15 @@ def main():
     print(f"[{provider}/{model}] Executing evaluation...")
     print(f"[{provider}/{model}] Output will be in: {history_dir}")
 
-    # Execute with live output
-    exit_code = subprocess.run(cmd).returncode
+    # Execute with live output, parsed line by line
+    exit_code, failed_skills = run_streaming(cmd)
 
     if exit_code == 0:
         print(f"[{provider}/{model}] ✅ Evaluation completed successfully")
     else:
         print(f"[{provider}/{model}] ❌ Evaluation failed with exit code {exit_code}")
+        if failed_skills:
+            print(f"[{provider}/{model}]    {failed_skills} skill(s) below threshold")
 
     # Save exit code and metadata for consolidation
     (history_dir / "exit_code").write_text(str(exit_code))
@@ -3,6 +3,17 @@ let flatSkills = [];
 let currentSkill = null;
 let currentSkillRuns = [];
 let currentTestIndex = 0;
+let sortedRuns = null;
+
+// Static lookup tables, built once at load instead of on every cell render
+const RATING_COLORS = { vague: "secondary", regular: "warning", good: "primary", outstanding: "success" };
+const RATING_STARS = {
+  vague: "⭐",
+  regular: "⭐⭐",
+  good: "⭐⭐⭐",
+  outstanding: "⭐⭐⭐⭐"
+};
+const IMPROVEMENT_COLORS = { yes: "success", no: "danger", neutral: "secondary" };
 
 function logStatus(msg, isError = false) {
   const el = document.getElementById("modal-debug-status");
@@ -109,28 +120,39 @@ function loadStateFromUrl() {
 }
 
 function getRatingColor(rating) {
-  const colors = { vague: "secondary", regular: "warning", good: "primary", outstanding: "success" };
-  return colors[rating] || "secondary";
+  return RATING_COLORS[rating] || "secondary";
 }
 
 function getRatingStars(rating) {
-  const stars = {
-    vague: "⭐",
-    regular: "⭐⭐",
-    good: "⭐⭐⭐",
-    outstanding: "⭐⭐⭐⭐"
-  };
-  return stars[rating] || "";
+  return RATING_STARS[rating] || "";
 }
 
 function getImprovementColor(improvement) {
-  const colors = { yes: "success", no: "danger", neutral: "secondary" };
-  return colors[improvement] || "secondary";
+  return IMPROVEMENT_COLORS[improvement] || "secondary";
 }
 
+// Memo for short, repeated strings (skill/provider/model names, dates);
+// long free text is escaped directly so the cache never pins it.
+const ESCAPE_CACHE = new Map();
+const ESCAPE_CACHE_MAX_ENTRIES = 1024;
+const ESCAPE_CACHE_MAX_LENGTH = 256;
+const HTML_ESCAPES = { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#039;" };
+const HTML_ESCAPE_RE = /[&<>"']/g;
+
 function escapeHtml(text) {
   if (!text) return "";
-  return text.replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;").replace(/"/g, "&quot;").replace(/'/g, "&#039;");
+  const cacheable = text.length <= ESCAPE_CACHE_MAX_LENGTH;
+  if (cacheable) {
+    const cached = ESCAPE_CACHE.get(text);
+    if (cached !== undefined) return cached;
+  }
+  // One scan with a lookup per match, instead of five chained replace passes
+  const escaped = text.replace(HTML_ESCAPE_RE, (ch) => HTML_ESCAPES[ch]);
+  if (cacheable) {
+    if (ESCAPE_CACHE.size >= ESCAPE_CACHE_MAX_ENTRIES) ESCAPE_CACHE.clear();
+    ESCAPE_CACHE.set(text, escaped);
+  }
+  return escaped;
 }
 
 function parseResponse(text) {
@@ -138,12 +160,12 @@ function parseResponse(text) {
   const files = [];
   const codeBlockRegex = /```(\w+)?[\s\r\n]*([\s\S]*?)```/g;
   let lastIndex = 0;
-  let commentary = "";
+  const commentaryParts = [];
   let match;
   let fileCount = 1;
 
   while ((match = codeBlockRegex.exec(text)) !== null) {
-    commentary += text.substring(lastIndex, match.index).trim() + "\n\n";
+    commentaryParts.push(text.substring(lastIndex, match.index).trim(), "\n\n");
     let lang = (match[1] || "").trim().toLowerCase();
     const content = match[2];
 
@@ -158,8 +180,8 @@ function parseResponse(text) {
     fileCount++;
     lastIndex = codeBlockRegex.lastIndex;
   }
-  commentary += text.substring(lastIndex).trim();
-  return { commentary: commentary.trim(), files };
+  commentaryParts.push(text.substring(lastIndex).trim());
+  return { commentary: commentaryParts.join("").trim(), files };
 }
 
 function renderFiles(paneId, files, codeViewId) {
@@ -299,11 +321,10 @@ function getLogoPath(provider, model) {
 function renderSummary(summary) {
   const tbody = document.getElementById("leaderboard-body");
   if (!tbody) return;
-  tbody.innerHTML = "";
 
+  // Build all rows as one string and parse them with a single innerHTML write
   const leaderboard = summary.leaderboard || [];
-  leaderboard.forEach((entry) => {
-    const row = document.createElement("tr");
+  const rows = leaderboard.map((entry) => {
     const logo = getLogoPath(entry.provider, entry.model);
     const logoHtml = logo ? `<img src="${logo}" width="20" height="20" class="me-2" style="object-fit: contain;">` : "";
 
@@ -311,7 +332,7 @@ function renderSummary(summary) {
     const statusClass = rate >= 70 ? "success" : (rate >= 40 ? "warning" : "danger");
     const statusText = rate >= 70 ? "ELITE" : (rate >= 40 ? "CAPABLE" : "RELIABLE?");
 
-    row.innerHTML = `
+    return `<tr>
       <td class="ps-4">
         <div class="d-flex align-items-center">
           ${logoHtml}
@@ -334,9 +355,9 @@ function renderSummary(summary) {
       <td class="pe-4 text-end">
         <span class="badge bg-${statusClass} opacity-75">${statusText}</span>
       </td>
-    `;
-    tbody.appendChild(row);
+    </tr>`;
   });
+  tbody.innerHTML = rows.join("");
 }
 
 function populateFilters(data) {
@@ -354,12 +375,14 @@ function populateFilters(data) {
     (b.skills || []).forEach((s) => { if (s.skill_name) skills.add(s.skill_name); });
   });
 
+  // Sets already dedupe; emit each list's options as one joined string
   const fill = (sel, items, def) => {
     if (!sel) return;
-    sel.innerHTML = `<option value="">${def}</option>`;
-    Array.from(items).sort().forEach(i => {
-      const o = document.createElement("option"); o.value = i; o.textContent = i; sel.appendChild(o);
+    const options = Array.from(items).sort().map((i) => {
+      const v = escapeHtml(String(i));
+      return `<option value="${v}">${v}</option>`;
     });
+    sel.innerHTML = `<option value="">${def}</option>` + options.join("");
   };
 
   fill(providerSelect, providers, "ALL PROVIDERS");
@@ -375,22 +398,16 @@ function formatDate(iso) {
   } catch (e) { return iso; }
 }
 
-function renderTable(benchmarks) {
-  flatSkills = [];
-  const tbody = document.getElementById("skills-table-body");
-  if (!tbody) return;
-  tbody.innerHTML = "";
+// Every skill run across benchmarks, with run-level defaults applied, newest
+// first. Built once per data load; table renders and the details modal index
+// into it instead of re-copying every skill object on each filter change.
+function getSortedRuns(benchmarks) {
+  if (sortedRuns) return sortedRuns;
 
-  const pFilter = (document.getElementById("filter-provider")?.value || "").toLowerCase();
-  const mFilter = (document.getElementById("filter-model")?.value || "").toLowerCase();
-  const sFilter = (document.getElementById("filter-skill")?.value || "").toLowerCase();
-  const iFilter = (document.getElementById("filter-improvement")?.value || "").toLowerCase();
-
-  // 1. Flatten all skills
-  const allRuns = [];
+  const runs = [];
   benchmarks.forEach((b) => {
     (b.skills || []).forEach((s) => {
-      allRuns.push({
+      runs.push({
         ...s,
         provider: s.provider || b.provider || "unknown",
         model: s.model || b.model || "unknown",
@@ -398,9 +415,24 @@ function renderTable(benchmarks) {
       });
     });
   });
+  runs.sort((a, b) => new Date(b.timestamp || 0) - new Date(a.timestamp || 0));
 
-  // 2. Sort all by date desc
-  allRuns.sort((a, b) => new Date(b.timestamp || 0) - new Date(a.timestamp || 0));
+  sortedRuns = runs;
+  return runs;
+}
+
+function renderTable(benchmarks) {
+  flatSkills = [];
+  const tbody = document.getElementById("skills-table-body");
+  if (!tbody) return;
+
+  const pFilter = (document.getElementById("filter-provider")?.value || "").toLowerCase();
+  const mFilter = (document.getElementById("filter-model")?.value || "").toLowerCase();
+  const sFilter = (document.getElementById("filter-skill")?.value || "").toLowerCase();
+  const iFilter = (document.getElementById("filter-improvement")?.value || "").toLowerCase();
+
+  // 1-2. All skill runs, flattened and sorted by date desc (cached)
+  const allRuns = getSortedRuns(benchmarks);
 
   // 3. Filter and Deduplicate
   let visibleRuns = [];
@@ -431,8 +463,8 @@ function renderTable(benchmarks) {
     });
   }
 
-  // 4. Render
-  visibleRuns.forEach((norm) => {
+  // 4. Render: one string for all rows, parsed by a single innerHTML write
+  const rows = visibleRuns.map((norm) => {
     const idx = flatSkills.length;
     flatSkills.push(norm);
 
@@ -440,8 +472,7 @@ function renderTable(benchmarks) {
     const sRating = norm.skill_rating || "vague";
     const imp = norm.improvement || "neutral";
 
-    const row = document.createElement("tr");
-    row.innerHTML = `
+    return `<tr>
       <td class="ps-4">
         <div class="fw-bold text-dark">${escapeHtml(norm.skill_name)}</div>
         <div class="text-muted" style="font-size: 10px">v${escapeHtml(norm.skill_version || "1.0.0")}</div>
@@ -459,9 +490,9 @@ function renderTable(benchmarks) {
       </td>
       <td><span class="badge bg-${getImprovementColor(imp)} rounded-pill px-3">${imp}</span></td>
       <td class="pe-4 text-end"><button class="btn btn-sm btn-primary shadow-sm" onclick="showDetails(${idx})">View</button></td>
-    `;
-    tbody.appendChild(row);
+    </tr>`;
   });
+  tbody.innerHTML = rows.join("");
 }
 
 function filterTable() {
@@ -474,24 +505,10 @@ function showDetails(index) {
     const originSkill = flatSkills[index];
     if (!originSkill) return;
 
-    // Find all runs for this same skill from ALL benchmarks (ignoring current filters)
-    const allRuns = [];
-    allData.benchmarks.forEach(b => {
-      (b.skills || []).forEach(s => {
-        if (s.skill_name === originSkill.skill_name) {
-          allRuns.push({
-            ...s,
-            provider: s.provider || b.provider || "unknown",
-            model: s.model || b.model || "unknown",
-            timestamp: s.timestamp || b.timestamp || ""
-          });
-        }
-      });
-    });
-    currentSkillRuns = allRuns;
-
-    // Sort runs by date (desc)
-    currentSkillRuns.sort((a, b) => new Date(b.timestamp || 0) - new Date(a.timestamp || 0));
+    // All runs for this same skill from ALL benchmarks (ignoring current
+    // filters); the cached list is already sorted by date (desc)
+    currentSkillRuns = getSortedRuns(allData.benchmarks)
+      .filter(r => r.skill_name === originSkill.skill_name);
 
     const selector = document.getElementById("modal-model-selector");
     selector.innerHTML = "";
@@ -583,6 +600,7 @@ async function loadDashboard() {
   try {
     const data = await fetchData();
     allData = data;
+    sortedRuns = null;
     renderSummary(data.summary || {});
     populateFilters(data);
     renderTable(data.benchmarks || []);
@@ -4,9 +4,14 @@ Codex CLI Adapter
 Imperative Shell: Subprocess calls isolated here.
 """
 
+import shutil
 import subprocess
 from domain import ModelConfig, Result, Success, Failure
 
+# Shell conventions for "found but could not execute" (126) and "command
+# not found" (127), e.g. a shim whose Node runtime is missing
+_NOT_RUNNABLE_RETURNCODES = (126, 127)
+
 
 class CodexCLIAdapter:
     """
@@ -47,6 +52,14 @@ class CodexCLIAdapter:
                 timeout=600,
             )
 
+            if result.returncode in _NOT_RUNNABLE_RETURNCODES:
+                # On PATH but not runnable: say so instead of a per-test model error
+                stderr = result.stderr.strip()
+                return Failure(
+                    f"Codex CLI not runnable (rc={result.returncode}): {stderr or 'could not execute'}",
+                    {"returncode": result.returncode, "stderr": stderr, "hint": "Install Codex CLI and sign in with ChatGPT"},
+                )
+
             if result.returncode != 0:
                 stderr = result.stderr.strip()
                 stdout = result.stdout.strip()
@@ -63,10 +76,11 @@ class CodexCLIAdapter:
                 "Codex CLI timeout after 600 seconds",
                 {"timeout": 600},
             )
-        except FileNotFoundError:
+        except OSError as e:
+            # Missing binary, stale shim or missing interpreter
             return Failure(
-                "Codex CLI not found",
-                {"hint": "Install Codex CLI and sign in with ChatGPT"},
+                f"Codex CLI not runnable: {e}",
+                {"error": str(e), "hint": "Install Codex CLI and sign in with ChatGPT"},
             )
         except Exception as e:
             return Failure(
@@ -78,12 +92,6 @@ class CodexCLIAdapter:
         """
         Check if Codex CLI is available.
         """
-        try:
-            result = subprocess.run(
-                ["codex", "--version"],
-                capture_output=True,
-                timeout=10,
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        # PATH lookup only: spawning the CLI just for --version costs a
+        # full Node startup
+        return shutil.which("codex") is not None
@@ -31,7 +31,8 @@ class RealFileSystem:
     def write_text(self, path: Path, content: str, encoding: str = 'utf-8') -> Result:
         """Write file, return Result instead of raising exception"""
         try:
-            path.write_text(content, encoding=encoding)
+            # Encode once and write the buffer directly (no text-layer chunking)
+            path.write_bytes(content.encode(encoding))
             return Success(None)
         except PermissionError:
             return Failure(f"Permission denied: {path}", {"path": str(path)})
@@ -55,9 +56,9 @@ class RealFileSystem:
         List directory contents.
         Returns empty list on error instead of raising.
         """
-        if not self.exists(path) or not self.is_dir(path):
-            return []
         try:
+            # iterdir raises for missing paths and non-directories, so no
+            # separate exists/is_dir probes are needed
             return list(path.iterdir())
         except PermissionError:
             return []
@@ -7,8 +7,8 @@ Supports both local Ollama and Ollama Cloud.
 
 import json
 import os
-import urllib.request
-import urllib.error
+import socket
+from urllib.parse import urlparse
 from domain import ModelConfig, Result, Success, Failure
 
 
@@ -58,6 +58,10 @@ class OllamaAdapter:
             base_url = config.base_url
             headers = {'Content-Type': 'application/json'}
         
+        # Imported lazily: report-only CLI paths never make HTTP calls
+        import urllib.request
+        import urllib.error
+        
         url = f"{base_url}/api/chat"
         data = {
             "model": config.model_name,
@@ -112,10 +116,12 @@ class OllamaAdapter:
             # For cloud, just check if API key is set
             return os.environ.get('OLLAMA_API_KEY') is not None
         
-        # For local, check if server is running
+        # For local, a TCP connect is enough to know the server is up
+        parsed = urlparse(config.base_url.replace('/v1', ''))
+        host = parsed.hostname or 'localhost'
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
         try:
-            host = config.base_url.replace('/v1', '')
-            urllib.request.urlopen(f"{host}/api/tags", timeout=5)
-            return True
-        except Exception:
+            with socket.create_connection((host, port), timeout=0.5):
+                return True
+        except OSError:
             return False
@@ -5,10 +5,17 @@ This module provides semantic evaluation of code responses using an LLM judge,
 rather than relying solely on mechanical pattern matching.
 """
 
+import re
 from dataclasses import dataclass
 from typing import Literal
 
 
+# Response-cleanup patterns, compiled once
+_THOUGHT_BLOCK_RE = re.compile(r'<thought>.*?</thought>', re.DOTALL | re.IGNORECASE)
+_JSON_OBJECT_RE = re.compile(r'(\{.*?\})', re.DOTALL)
+_JSON_OBJECT_GREEDY_RE = re.compile(r'(\{.*\})', re.DOTALL)
+
+
 @dataclass(frozen=True)
 class JudgmentResult:
     """Result of blind LLM comparison evaluation."""
@@ -142,18 +149,17 @@ def parse_judgment_response(response: str) -> JudgmentResult:
         ValueError: If response is not valid JSON or missing required fields
     """
     import json
-    import re
     
     # 1. Strip thought blocks (reasoning models like DeepSeek-R1)
-    cleaned_response = re.sub(r'<thought>.*?</thought>', '', response, flags=re.DOTALL | re.IGNORECASE)
+    cleaned_response = _THOUGHT_BLOCK_RE.sub('', response)
     
     # 2. Find all potential { ... } blocks
     # We use a non-greedy match for the content to find individual objects
-    candidates = re.findall(r'(\{.*?\})', cleaned_response, re.DOTALL)
+    candidates = _JSON_OBJECT_RE.findall(cleaned_response)
     
     # If no candidates found with non-greedy, try a broader greedy match as fallback
     if not candidates:
-        json_match = re.search(r'(\{.*\})', cleaned_response, re.DOTALL)
+        json_match = _JSON_OBJECT_GREEDY_RE.search(cleaned_response)
         if json_match:
             candidates = [json_match.group(1)]
     
@@ -9,6 +9,12 @@ import re
 from .types import Severity
 
 
+# Frontmatter field patterns, compiled once
+_DESCRIPTION_RE = re.compile(r'description:\s*["\']?(.+?)["\']?\s*\n')
+_SEVERITY_RE = re.compile(r'severity:\s*(\w+)')
+_VERSION_RE = re.compile(r'version:\s*["\']?([\d\.]+)["\']?\s*\n')
+
+
 def parse_skill_frontmatter(content: str) -> tuple[str, Severity, str]:
     """
     Extract description, severity and version from YAML frontmatter.
@@ -26,22 +32,21 @@ def parse_skill_frontmatter(content: str) -> tuple[str, Severity, str]:
     severity = Severity.SUGGEST
     version = "1.0.0"
     
-    if not content.startswith("---"):
+    if not content.startswith("---\n"):
         return description, severity, version
     
-    frontmatter_match = re.search(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not frontmatter_match:
+    # Frontmatter spans content[4:end]; searches below are bounded to it
+    end = content.find("\n---", 4)
+    if end == -1:
         return description, severity, version
     
-    frontmatter = frontmatter_match.group(1)
-    
     # Extract description
-    desc_match = re.search(r'description:\s*["\']?(.+?)["\']?\s*\n', frontmatter)
+    desc_match = _DESCRIPTION_RE.search(content, 4, end)
     if desc_match:
         description = desc_match.group(1)
     
     # Extract severity
-    sev_match = re.search(r'severity:\s*(\w+)', frontmatter)
+    sev_match = _SEVERITY_RE.search(content, 4, end)
     if sev_match:
         try:
             severity = Severity(sev_match.group(1).upper())
@@ -50,7 +55,7 @@ def parse_skill_frontmatter(content: str) -> tuple[str, Severity, str]:
             severity = Severity.SUGGEST
             
     # Extract version
-    ver_match = re.search(r'version:\s*["\']?([\d\.]+)["\']?\s*\n', frontmatter)
+    ver_match = _VERSION_RE.search(content, 4, end)
     if ver_match:
         version = ver_match.group(1)
     
@@ -70,11 +75,17 @@ def extract_description_from_content(content: str) -> str:
     Returns:
         First non-empty, non-header line
     """
-    lines = content.split('\n')
-    for line in lines:
-        stripped = line.strip()
+    # Scan line by line without splitting the whole document up front
+    start = 0
+    length = len(content)
+    while start <= length:
+        newline = content.find('\n', start)
+        if newline == -1:
+            newline = length
+        stripped = content[start:newline].strip()
         if stripped and not stripped.startswith('#') and not stripped.startswith('---'):
             return stripped
+        start = newline + 1
     return ""
 
 
@@ -7,6 +7,9 @@ Extracts the full skill content minus metadata to ensure the model has full cont
 import re
 
 
+_FRONTMATTER_RE = re.compile(r'^---\n.*?\n---\n', re.DOTALL)
+
+
 def extract_skill_guidance(skill_content: str) -> str:
     """
     Extract skill guidance for model prompting.
@@ -16,7 +19,7 @@ def extract_skill_guidance(skill_content: str) -> str:
     """
     # Remove frontmatter if present
     if skill_content.startswith("---"):
-        content = re.sub(r'^---\n.*?\n---\n', '', skill_content, count=1, flags=re.DOTALL)
+        content = _FRONTMATTER_RE.sub('', skill_content, count=1)
         return content.strip()
     
     return skill_content.strip()
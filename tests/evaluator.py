@@ -18,6 +18,7 @@ Applied Skills:
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -38,6 +39,9 @@ from services import (
 # Adapter imports
 from adapters import RealFileSystem, OllamaAdapter, CopilotCLIAdapter, CodexCLIAdapter, GeminiCLIAdapter
 
+# Concurrent skills per run unless --jobs says otherwise
+DEFAULT_MAX_JOBS = 4
+
 
 def _timestamp_id() -> str:
     import time
@@ -54,13 +58,62 @@ def _safe_model_name(model_name: str) -> str:
 
 
 def _find_latest_summary(history_dir: Path) -> Path | None:
+    # One scandir pass keeping the newest match: no Path per entry and no
+    # sort over every candidate
     try:
-        candidates = sorted(history_dir.glob("summary-*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
-        return candidates[0] if candidates else None
+        latest = None
+        latest_mtime = None
+        with os.scandir(history_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("summary-") and name.endswith(".json")):
+                    continue
+                mtime = entry.stat().st_mtime
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest, latest_mtime = entry.path, mtime
+        return Path(latest) if latest else None
     except Exception:
         return None
 
 
+def _print_evaluation_result(eval_result) -> None:
+    """Display one skill's ratings and optional judge verdict."""
+    print(f"\nTesting: {eval_result.skill_name}")
+    print("-" * 40)
+    
+    # Use semantic ratings and qualitative labels
+    baseline_rating = eval_result.baseline_rating
+    skill_rating = eval_result.skill_rating
+    baseline_count = eval_result.baseline_pass_count
+    skill_count = eval_result.skill_pass_count
+    
+    if eval_result.judgment:
+        judge = eval_result.judgment
+        overall_better = judge.overall_better
+        if overall_better == 'B':
+            imp_label = "yes"
+        elif overall_better == 'A':
+            imp_label = "no"
+        else:
+            imp_label = "neutral"
+            
+        print(
+            f"  Without Skill: {baseline_rating} ({baseline_count}) | "
+            f"With Skill: {skill_rating} ({skill_count}) | "
+            f"Improvement: {imp_label}"
+        )
+        skill_won = overall_better == "B"
+        verdict = "✓ Better" if skill_won else ("Equal" if overall_better == "Equal" else "✗ No improvement")
+        print(f"  🤖 Judge: {verdict} (score: {judge.score}/100)")
+        print(f"     {judge.reasoning}")
+    else:
+        print(
+            f"  Without Skill: {baseline_rating} ({baseline_count}) | "
+            f"With Skill: {skill_rating} ({skill_count}) | "
+            f"Improvement: {eval_result.improvement:+}%"
+        )
+
+
 def main() -> int:
     """
     Main entry point - Composition Root.
@@ -89,6 +142,12 @@ def main() -> int:
     parser.add_argument("--ollama-cloud", action="store_true", help="Use Ollama Cloud instead of local")
     parser.add_argument("--base-url", help="Base URL for model API (default: http://localhost:11434 for Ollama)")
     parser.add_argument("--history-dir", help="Custom history directory (default: tests/data-history)")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help=f"Skills evaluated concurrently (default: 1 for Ollama, else up to {DEFAULT_MAX_JOBS})"
+    )
     args = parser.parse_args()
     
     # Wire up adapters (Dependency Injection)
@@ -239,54 +298,39 @@ def main() -> int:
     print(f"Model: {config.model_name} | Provider: {config.provider.value}")
     print(f"{'=' * 60}")
     
-    all_results = []
-    
+    # Generate test suites up front (cheap, no model calls)
+    test_suites = {}
     for skill in skills_to_test:
-        print(f"\nTesting: {skill.name}")
-        print("-" * 40)
-        
-        # Generate test suite
-        test_suite = generate_test_suite(skill, fs)
-        print(f"  Generated {test_suite.test_count} test cases")
-        
-        # Run evaluation
-        eval_result = run_evaluation(
-            skill, test_suite, model_port, config, args.verbose, args.judge
-        )
-        all_results.append(eval_result)
-        
-        # Display results
-        # Use semantic ratings and qualitative labels
-        baseline_rating = eval_result.baseline_rating
-        skill_rating = eval_result.skill_rating
-        baseline_count = eval_result.baseline_pass_count
-        skill_count = eval_result.skill_pass_count
-        
-        if eval_result.judgment:
-            judge = eval_result.judgment
-            overall_better = judge.overall_better
-            if overall_better == 'B':
-                imp_label = "yes"
-            elif overall_better == 'A':
-                imp_label = "no"
-            else:
-                imp_label = "neutral"
-                
-            print(
-                f"  Without Skill: {baseline_rating} ({baseline_count}) | "
-                f"With Skill: {skill_rating} ({skill_count}) | "
-                f"Improvement: {imp_label}"
-            )
-            skill_won = overall_better == "B"
-            verdict = "✓ Better" if skill_won else ("Equal" if overall_better == "Equal" else "✗ No improvement")
-            print(f"  🤖 Judge: {verdict} (score: {judge.score}/100)")
-            print(f"     {judge.reasoning}")
-        else:
-            print(
-                f"  Without Skill: {baseline_rating} ({baseline_count}) | "
-                f"With Skill: {skill_rating} ({skill_count}) | "
-                f"Improvement: {eval_result.improvement:+}%"
-            )
+        test_suites[skill.name] = generate_test_suite(skill, fs)
+        print(f"  {skill.name}: generated {test_suites[skill.name].test_count} test cases")
+    
+    # Skills are independent: dispatch model-bound evaluations concurrently.
+    # Threads suffice because workers block on HTTP/subprocess IO.
+    import concurrent.futures
+    
+    # A single Ollama server queues requests, so parallel skills only add timeouts
+    if provider == Provider.OLLAMA:
+        default_jobs = 1
+    else:
+        default_jobs = min(len(skills_to_test), DEFAULT_MAX_JOBS)
+    jobs = args.jobs or default_jobs
+    results_by_skill = {}
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = {
+            executor.submit(
+                run_evaluation,
+                skill, test_suites[skill.name], model_port, config, args.verbose, args.judge
+            ): skill
+            for skill in skills_to_test
+        }
+        for future in concurrent.futures.as_completed(futures):
+            eval_result = future.result()
+            results_by_skill[eval_result.skill_name] = eval_result
+            _print_evaluation_result(eval_result)
+    
+    # Keep summary order stable (sorted by skill name, as discovered)
+    all_results = [results_by_skill[skill.name] for skill in skills_to_test]
     
     timestamp_id = _timestamp_id()
     timestamp_iso = _timestamp_iso()
@@ -47,32 +47,34 @@ def run_evaluation(
         EvaluationResult with baseline and skill results
     """
     skill_instruction = build_skill_instruction(skill.content)
+    # Skills run concurrently, so every progress line names its skill
+    tag = f"[{skill.name}] "
     
     baseline_results = []
     skill_results = []
     
     for test in test_suite.tests:
         if verbose:
-            print(f"    Running test: {test.name}...")
+            print(f"    {tag}Running test: {test.name}...")
         
         # Baseline run (no skill context)
         baseline_result = _run_single_test(
-            test, model_port, config, ""
+            test, model_port, config, "", tag
         )
         baseline_results.append(baseline_result)
         
         # Skill run (with skill instruction)
         skill_result = _run_single_test(
-            test, model_port, config, skill_instruction
+            test, model_port, config, skill_instruction, tag
         )
         skill_results.append(skill_result)
         
         # Verbose output
         if verbose:
             if not baseline_result.passed:
-                print(f"      [BASELINE FAIL] {test.name}: {baseline_result.failure_reason}")
+                print(f"      {tag}[BASELINE FAIL] {test.name}: {baseline_result.failure_reason}")
             if not skill_result.passed:
-                print(f"      [SKILL FAIL] {test.name}: {skill_result.failure_reason}")
+                print(f"      {tag}[SKILL FAIL] {test.name}: {skill_result.failure_reason}")
     
     # Optional: Run LLM judge evaluation
     judgment = None
@@ -98,7 +100,8 @@ def _run_single_test(
     test: TestCase,
     model_port: ModelPort,
     config: ModelConfig,
-    skill_instruction: str
+    skill_instruction: str,
+    tag: str = ""
 ) -> TestResult:
     """
     Run a single test case.
@@ -111,6 +114,7 @@ def _run_single_test(
         model_port: AI model adapter
         config: Model configuration
         skill_instruction: Optional skill context (empty for baseline)
+        tag: Log line prefix naming the skill
         
     Returns:
         TestResult with pass/fail and response
@@ -124,7 +128,7 @@ def _run_single_test(
     # Handle model errors
     if is_failure(result):
         # Always print model errors, not just in verbose mode
-        print(f"      [MODEL ERROR] {test.name}: {result.error_message}")
+        print(f"      {tag}[MODEL ERROR] {test.name}: {result.error_message}")
         return TestResult(
             test_name=test.name,
             passed=False,
@@ -174,8 +178,9 @@ def _run_judge_evaluation(
     Returns:
         JudgmentResult or None if judgment fails
     """
+    tag = f"[{skill.name}] "
     if verbose:
-        print("    Running blind comparison evaluation...")
+        print(f"    {tag}Running blind comparison evaluation...")
     
     # Combine all responses (focus on actual code, not individual test results)
     without_skill_response = "\n\n".join(r.response for r in baseline_results if r.response)
@@ -183,7 +188,7 @@ def _run_judge_evaluation(
     
     if not without_skill_response or not with_skill_response:
         if verbose:
-            print("      [JUDGE SKIP] Missing responses to evaluate")
+            print(f"      {tag}[JUDGE SKIP] Missing responses to evaluate")
         return None
     
     # Consistent naming for debugging: A = without_skill, B = with_skill (no randomization)
@@ -222,7 +227,7 @@ def _run_judge_evaluation(
         
         if is_failure(result):
             if verbose:
-                print(f"      [JUDGE ERROR] Attempt {attempts}: {result.error_message}")
+                print(f"      {tag}[JUDGE ERROR] Attempt {attempts}: {result.error_message}")
             return None
         
         # Parse judgment
@@ -248,16 +253,16 @@ def _run_judge_evaluation(
             if verbose:
                 overall_better = judgment.overall_better
                 imp_label = "yes" if overall_better == 'B' else ("no" if overall_better == 'A' else "neutral")
-                print(f"      [JUDGE] improvement: {imp_label} (score: {judgment.score}/100 = {with_skill_passed}/{total_tests} tests)")
+                print(f"      {tag}[JUDGE] improvement: {imp_label} (score: {judgment.score}/100 = {with_skill_passed}/{total_tests} tests)")
             return judgment
             
         except ValueError as e:
             if verbose:
-                print(f"      [JUDGE PARSE ERROR] Attempt {attempts}: {e}")
+                print(f"      {tag}[JUDGE PARSE ERROR] Attempt {attempts}: {e}")
             
             if attempts < max_attempts:
                 if verbose:
-                    print("      [JUDGE RETRY] Requesting correction...")
+                    print(f"      {tag}[JUDGE RETRY] Requesting correction...")
                 # Update prompt for next attempt with error feedback
                 correction_feedback = f"\n\nERROR FROM LAST ATTEMPT: {str(e)}\nYour previous response could not be parsed. Please respond ONLY with the corrected JSON object matching the requested schema strictly."
                 current_prompt = prompt + correction_feedback
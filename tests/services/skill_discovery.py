@@ -30,17 +30,13 @@ def discover_skills(skills_dir: Path, fs: FileSystemPort) -> tuple[Skill, ...]:
         return tuple(skills)
     
     for item in fs.list_dir(skills_dir):
-        if not fs.is_dir(item):
+        if item.name.startswith(".") or not fs.is_dir(item):
             continue
         
-        skill_file = item / "SKILL.md"
-        if not fs.exists(skill_file):
-            continue
-        
-        # Read skill file
-        result = fs.read_text(skill_file)
+        # A missing SKILL.md fails the read, so no separate exists probe
+        result = fs.read_text(item / "SKILL.md")
         if is_failure(result):
-            # Skip skills we can't read
+            # Skip folders without a readable SKILL.md
             continue
         
         content = result.value
@@ -93,3 +93,87 @@ def _load_tests_from_json(json_path: Path, fs: FileSystemPort, skill_path: Path)
         return Failure(f"Invalid JSON in {json_path}", {"error": str(e)})
 
     # Note: _inject_external_files removed directly as per refactor plan
+
+
+# "### ✅ ..." / "### ❌ ..." example headings in SKILL.md
+_EXAMPLE_HEADING_RE = re.compile(r"^### (\u2705|\u274c)")
+
+_MAX_EXAMPLE_CHARS = 500
+
+
+def _extract_tests_from_markdown(content: str) -> list[TestCase]:
+    """
+    Build fallback test cases from ✅/❌ examples in SKILL.md.
+    
+    Single pass over the lines: a heading starting `### ✅` or `### ❌`
+    arms the scanner, and the next fenced block under it is captured as a
+    good or bad example. Fences are tracked on every line, so headings
+    inside code blocks are ignored. Bad examples become refactor tasks,
+    good ones become review tasks.
+    
+    Args:
+        content: Skill markdown content
+        
+    Returns:
+        List of TestCase objects (empty if no examples found)
+    """
+    good_examples = []
+    bad_examples = []
+    
+    in_fence = False
+    armed = None    # Example list the next fence is captured into
+    capture = None  # Example list the open fence is captured into
+    buffer = []
+    buffered = 0
+    
+    for line in content.splitlines():
+        if line.startswith("```"):
+            if not in_fence:
+                in_fence = True
+                capture, armed = armed, None
+            else:
+                in_fence = False
+                if capture is not None:
+                    capture.append("\n".join(buffer)[:_MAX_EXAMPLE_CHARS])
+                    capture = None
+                    buffer = []
+                    buffered = 0
+            continue
+        
+        if in_fence:
+            if capture is not None and buffered < _MAX_EXAMPLE_CHARS:
+                # Only the prefix is used; stop buffering once it is covered
+                buffer.append(line)
+                buffered += len(line) + 1
+            continue
+        
+        if line.startswith("### "):
+            match = _EXAMPLE_HEADING_RE.match(line)
+            if match is None:
+                armed = None
+            elif match.group(1) == "\u2705":
+                armed = good_examples
+            else:
+                armed = bad_examples
+    
+    tests = []
+    for i, example in enumerate(bad_examples, 1):
+        tests.append(TestCase(
+            name=f"refactor_bad_example_{i}",
+            input_prompt=(
+                "Refactor the following code to fix its design problems. "
+                f"Provide the complete refactored code:\n\n```\n{example}\n```\n"
+            ),
+            expected={"focus": "Does the refactor remove the problems shown in the bad example?"}
+        ))
+    for i, example in enumerate(good_examples, 1):
+        tests.append(TestCase(
+            name=f"explain_good_example_{i}",
+            input_prompt=(
+                "Explain the design strengths of the following code and write a "
+                f"similar example for a different domain:\n\n```\n{example}\n```\n"
+            ),
+            expected={"focus": "Does the answer identify and reuse the principle shown?"}
+        ))
+    
+    return tests